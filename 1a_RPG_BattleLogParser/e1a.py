@@ -6,19 +6,25 @@ def main():
 
     hp = 250
     all_monsters = set()
+    hp_log = []
     for line in data:
-        words = line.split()
+        # Lines have a fixed shape, no need to split past the 7th word
+        words = line.split(None, 6)
 
 
         if words[1] == "took":
             hp -= int(words[2])
-            print(hp)
+            hp_log.append(hp)
         elif words[1] == "hit":
             all_monsters.add(words[3])
         elif words[1]  == "takes":
             hp += int(words[5])
             hp = min(hp, 250)
-            print(hp)
+            hp_log.append(hp)
+
+    # One write for the whole HP history instead of one print per line
+    if hp_log:
+        print("\n".join(map(str, hp_log)))
 
     print(f"Final Health after all battles: {hp}")
     print(f"Fought the following {len(all_monsters)} monsters: \n{all_monsters}")
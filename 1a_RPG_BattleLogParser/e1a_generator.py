@@ -5,30 +5,41 @@ from typing import List
 
 
 POTION_LINE = "Player takes a potion, healing 100 health points."
+HIT_LINE = "Player hit the %s for %d dmg"
+TOOK_LINE = "Player took %d dmg from the %s"
 
+PLAYER_DMG = range(3, 16)
+MONSTER_DMG = range(2, 15)
 
-def gen_monster_name(rng: random.Random) -> str:
-    starts = ["Gr", "Sk", "Bl", "Cr", "Wr", "Th", "Gh", "Br", "Sl", "Kn", "Z", "V", "Dr", "Kr", "M", "N"]
-    vowels = ["a", "e", "i", "o", "u", "y"]
-    mids = ["rg", "zg", "bl", "kr", "dr", "sk", "gl", "gn", "zz", "lm", "rk", "sh", "th", "gr", "vr", "nd", "st", "mp"]
-    ends = ["ling", "gore", "fang", "spawn", "wraith", "fiend", "maw", "claw", "hound", "beast",
-            "drake", "ghoul", "spike", "stalker", "bane", "lurker"]
-    name = rng.choice(starts) + rng.choice(vowels) + rng.choice(mids) + rng.choice(vowels) + rng.choice(ends)
-    return name.capitalize()
+WRITE_CHUNK_LINES = 65536
+
+
+_STARTS = ("Gr", "Sk", "Bl", "Cr", "Wr", "Th", "Gh", "Br", "Sl", "Kn", "Z", "V", "Dr", "Kr", "M", "N")
+_VOWELS = ("a", "e", "i", "o", "u", "y")
+_MIDS = ("rg", "zg", "bl", "kr", "dr", "sk", "gl", "gn", "zz", "lm", "rk", "sh", "th", "gr", "vr", "nd", "st", "mp")
+_ENDS = ("ling", "gore", "fang", "spawn", "wraith", "fiend", "maw", "claw", "hound", "beast",
+         "drake", "ghoul", "spike", "stalker", "bane", "lurker")
+
+
+def gen_monster_names(rng: random.Random, count: int) -> List[str]:
+    """Draw `count` names at once, one bulk random.choices call per name part."""
+    starts = rng.choices(_STARTS, k=count)
+    vowels1 = rng.choices(_VOWELS, k=count)
+    mids = rng.choices(_MIDS, k=count)
+    vowels2 = rng.choices(_VOWELS, k=count)
+    ends = rng.choices(_ENDS, k=count)
+    return [(s + v1 + m + v2 + e).capitalize() for s, v1, m, v2, e in zip(starts, vowels1, mids, vowels2, ends)]
 
 
 def build_encounter_lines(monster: str, length: int, rng: random.Random) -> List[str]:
-    lines: List[str] = []
-    attacker = "player" if rng.random() < 0.5 else "monster"
-    for _ in range(length):
-        if attacker == "player":
-            dmg = rng.randint(3, 15)
-            lines.append(f"Player hit the {monster} for {dmg} dmg")
-            attacker = "monster"
-        else:
-            dmg = rng.randint(2, 14)
-            lines.append(f"Player took {dmg} dmg from the {monster}")
-            attacker = "player"
+    # Player and monster alternate, whoever opens is a coin flip
+    start = 0 if rng.random() < 0.5 else 1
+    n_player = (length + 1 - start) // 2
+    n_monster = length - n_player
+
+    lines: List[str] = [""] * length
+    lines[start::2] = [HIT_LINE % (monster, dmg) for dmg in rng.choices(PLAYER_DMG, k=n_player)]
+    lines[1 - start::2] = [TOOK_LINE % (dmg, monster) for dmg in rng.choices(MONSTER_DMG, k=n_monster)]
     return lines
 
 
@@ -72,30 +83,38 @@ def generate_battle_log(lines: int = 1000,
                         potion_ratio: float = 0.05,
                         min_enc: int = 3,
                         max_enc: int = 4,
-                        seed: int | None = None) -> List[str]:
+                        seed: int | None = None,
+                        verify: bool = False) -> List[str]:
     rng = random.Random(seed)
     num_potions = max(0, round(lines * potion_ratio))
     enc_sizes = plan_encounter_sizes_exact(lines, num_potions, min_enc, max_enc)
     num_encounters = len(enc_sizes)
     pots_after = distribute_potions_even(num_encounters, num_potions)
+    monsters = gen_monster_names(rng, num_encounters)
     out: List[str] = []
     for i, size in enumerate(enc_sizes):
-        monster = gen_monster_name(rng)
+        monster = monsters[i]
         out.extend(build_encounter_lines(monster, size, rng))
         if i < num_encounters - 1:
             out.extend([POTION_LINE] * pots_after[i])
     assert len(out) == lines, f"Output length mismatch: {len(out)} != {lines}"
-    for s in out:
-        if s == POTION_LINE:
-            continue
-        if not (s.startswith("Player hit the ") or s.startswith("Player took ")):
-            raise AssertionError(f"Unexpected line format: {s}")
+    if verify:
+        # Full per-line format scan, only on request: every line comes from the fixed templates above
+        for s in out:
+            if s == POTION_LINE:
+                continue
+            if not (s.startswith("Player hit the ") or s.startswith("Player took ")):
+                raise AssertionError(f"Unexpected line format: {s}")
     return out
 
 
 def write_lines(path: str, lines: List[str]) -> None:
+    # Join and write in chunks so huge logs never need one giant string in memory
     with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        for start in range(0, len(lines), WRITE_CHUNK_LINES):
+            if start:
+                f.write("\n")
+            f.write("\n".join(lines[start:start + WRITE_CHUNK_LINES]))
 
 
 def parse_args():
@@ -107,6 +126,7 @@ def parse_args():
     p.add_argument("--max-enc", type=int, default=4, help="Maximum lines per encounter.")
     p.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility.")
     p.add_argument("--outfile", type=str, default="battle_log.txt", help="Output file path.")
+    p.add_argument("--verify", action="store_true", help="Check the format of every generated line.")
     return p.parse_args()
 
 
@@ -122,7 +142,8 @@ def main():
                                     potion_ratio=args.potion_ratio,
                                     min_enc=args.min_enc,
                                     max_enc=args.max_enc,
-                                    seed=args.seed)
+                                    seed=args.seed,
+                                    verify=args.verify)
     write_lines(args.outfile, log_lines)
     print(f"Wrote {len(log_lines)} lines to {args.outfile}")
 
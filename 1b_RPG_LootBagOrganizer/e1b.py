@@ -1,4 +1,4 @@
-import re
+from array import array
 
 
 def to_copper(g=0, s=0, c=0) -> int:
@@ -18,9 +18,8 @@ def to_gsc(c) -> tuple[int, int, int]:
 def summarize_all_winnings(loot) -> tuple[int, int, int]:
     copper_value = 0
 
-    for item in loot:
-        for all_values in loot[item][1]:
-            copper_value += to_copper(all_values[0], all_values[1], all_values[2])
+    for _, _, all_copper in loot.values():
+        copper_value += sum(all_copper)
 
     return to_gsc(copper_value)
 
@@ -28,15 +27,8 @@ def summarize_all_winnings(loot) -> tuple[int, int, int]:
 def summarize_winnings_bestof(loot):
     copper_value = 0
 
-    for item in loot:
-        best_value = 0
-        for value_gsc in loot[item][1]:
-            value_c = to_copper(value_gsc[0], value_gsc[1], value_gsc[2])
-
-            if value_c > best_value:
-                best_value = value_c
-
-        copper_value += best_value
+    for _, _, all_copper in loot.values():
+        copper_value += max(all_copper, default=0)
 
     return to_gsc(copper_value)
 
@@ -46,46 +38,50 @@ def detect_value(list_value):
     silver = 0
     copper = 0
 
-    gold = re.findall(r'\d+ gold', ", ".join(list_value))
-    silver = re.findall(r'\d+ silver', ", ".join(list_value))
-    copper = re.findall(r'\d+ copper', ", ".join(list_value))
+    # Each token is shaped "<amount> <unit>", the unit's first letter is enough
+    for token in list_value:
+        parts = token.split()
+        if len(parts) < 2:
+            continue
 
-    if len(gold) > 0:
-        gold = int(gold[0].split()[0])
-    else:
-        gold = 0
+        value = int(parts[0])
+        unit = parts[1][0]
 
-    if len(silver) > 0:
-        silver = int(silver[0].split()[0])
-    else:
-        silver = 0
-
-    if len(copper) > 0:
-        copper = int(copper[0].split()[0])
-    else:
-        copper = 0
+        if unit == "g":
+            gold = value
+        elif unit == "s":
+            silver = value
+        else:
+            copper = value
 
     return gold, silver, copper
 
 
 def main():
     with open("./data/loot_log.txt", "r") as file:
-        data = file.readlines()
+        data = file.read().splitlines()
 
     loot = {}
+    collected = []
     for line in data:
         parts = line.strip().split(', ')
 
         item = parts[0]
-        print(f"Collected a {item}")
+        collected.append(f"Collected a {item}")
 
         if item not in loot:
-            loot[item] = [0, []]
+            # [count, (g, s, c) values, same values in copper]
+            loot[item] = [0, [], array("l")]
 
         loot[item][0] += 1
         valueGSC = detect_value(parts[1:])
         valueInCopper = to_copper(valueGSC[0], valueGSC[1], valueGSC[2])
         loot[item][1].append(valueGSC)
+        loot[item][2].append(valueInCopper)
+
+    # One write for the whole pickup log instead of one print per line
+    if collected:
+        print("\n".join(collected))
 
     total_value = summarize_all_winnings(loot)
     print(f"The total value of all the loot in Gold, Silver and copper coins is {total_value}")
@@ -1,114 +1,101 @@
-def find_start(data):
-    for y, row in enumerate(data):
-        for x, tile in enumerate(row):
-            if tile == 'P':
-                return x, y
+# Tiles as byte values, the level is a flat bytearray indexed by y * cols + x
+EMPTY = ord('.')
+COIN = ord('C')
+WALL = ord('#')
+PLAYER = ord('P')
+TRAIL = ord('-')
 
-    return None
+# (dx, dy) per move, anything unknown stays in place
+MOVE_DELTAS = {'R': (1, 0), 'L': (-1, 0), 'U': (0, -1), 'D': (0, 1)}
+
+# Same deltas as lookup tables indexed by the raw move byte
+DX_LUT = [MOVE_DELTAS.get(chr(b), (0, 0))[0] for b in range(256)]
+DY_LUT = [MOVE_DELTAS.get(chr(b), (0, 0))[1] for b in range(256)]
+
+
+def find_start(grid, cols):
+    idx = grid.find(PLAYER)
+    if idx == -1:
+        return None
+
+    return idx % cols, idx // cols
+
+
+def parse_moves(raw):
+    """
+    Convert the raw bytes of the moves file (one move letter per line) into two lists of x and y deltas.
+    Line breaks are dropped in one pass, then each move byte is looked up in the delta tables.
+    """
+    codes = raw.translate(None, b" \t\r\n")
+    dx = [DX_LUT[code] for code in codes]
+    dy = [DY_LUT[code] for code in codes]
+    return dx, dy
 
 
 def parse_level(level):
     """
-    Convert a list of strings (lines from file) into a 2D list of characters.
+    Convert a list of strings (lines from file) into a flat bytearray of tiles and its row width.
     Automatically strips newlines and ignores empty lines.
     """
-    grid = []
-    for line in level:
-        row = list(line.rstrip("\n"))  # remove newline, then split into chars
-        if row:  # skip empty lines
-            grid.append(row)
-    return grid
+    rows = [line.rstrip("\n").encode() for line in level]
+    rows = [row for row in rows if row]  # skip empty lines
+    cols = len(rows[0]) if rows else 0
+    return bytearray(b"".join(rows)), cols
 
 
-def main():
+def run(level, cols, dx, dy, x, y, trail):
+    """
+    Play all the moves from (x, y) on the flat level, collecting coins (the level is modified in place).
+    With trail on, every cell left behind becomes a tron trail that blocks like a wall.
+    Returns (coins, final_x, final_y).
+    """
+    coins = 0
+    for mx, my in zip(dx, dy):
+        nx = x + mx
+        ny = y + my
+
+        tile = level[ny * cols + nx]
+        if tile == EMPTY:
+            if trail:
+                level[y * cols + x] = TRAIL
+            x, y = nx, ny
+        elif tile == COIN:
+            coins += 1
+            if trail:
+                level[y * cols + x] = TRAIL
+            x, y = nx, ny
+            level[y * cols + x] = EMPTY
+        # WALL / TRAIL: Do not assign the new position, this is a wall or the tron trail
+
+    return coins, x, y
+
+
+def load_and_run(trail):
     with open("data/level.txt") as file:
         level = file.readlines()
-    level = parse_level(level)
+    level, cols = parse_level(level)
 
-    with open("data/moves.txt") as file2:
-        moves = file2.readlines()
+    with open("data/moves.txt", "rb") as file2:
+        dx, dy = parse_moves(file2.read())
 
-    pos = find_start(level)
-    new_pos = pos
-    coins = 0
+    x, y = find_start(level, cols)
 
     #Remove the P from the level, we got it
-    level[pos[1]][pos[0]] = '.'
-
-    for move in moves:
-        move = move.strip()
-        new_pos = pos
-        match move:
-            case 'R':
-                new_pos = (pos[0] + 1, pos[1])
-            case 'L':
-                new_pos = (pos[0] - 1, pos[1])
-            case 'U':
-                new_pos = (pos[0], pos[1] - 1)
-            case 'D':
-                new_pos = (pos[0], pos[1] + 1)
-
-        match level[new_pos[1]][new_pos[0]]:
-            case '.':
-                pos = (new_pos[0], new_pos[1])
-            case 'C':
-                coins += 1
-                pos = (new_pos[0], new_pos[1])
-                level[pos[1]][pos[0]] = '.'
-            case '#':
-                ... #Do not assign the new position, this is a wall
-            case _:
-                ... # Should not happen
+    level[y * cols + x] = EMPTY
+
+    coins, _, _ = run(level, cols, dx, dy, x, y, trail)
+    return coins
+
 
+def main():
+    coins = load_and_run(trail=False)
     print(f"Amongst my path into the Maze I've collected {coins} coins.")
 
 
 def main_extended():
     print("Activating the tron trail...")
 
-    with open("data/level.txt") as file:
-        level = file.readlines()
-    level = parse_level(level)
-
-    with open("data/moves.txt") as file2:
-        moves = file2.readlines()
-
-    pos = find_start(level)
-    new_pos = pos
-    coins = 0
-
-    #Remove the P from the level, we got it
-    level[pos[1]][pos[0]] = '.'
-
-    for move in moves:
-        move = move.strip()
-        new_pos = pos
-        match move:
-            case 'R':
-                new_pos = (pos[0] + 1, pos[1])
-            case 'L':
-                new_pos = (pos[0] - 1, pos[1])
-            case 'U':
-                new_pos = (pos[0], pos[1] - 1)
-            case 'D':
-                new_pos = (pos[0], pos[1] + 1)
-
-        match level[new_pos[1]][new_pos[0]]:
-            case '.':
-                level[pos[1]][pos[0]] = '-'
-                pos = (new_pos[0], new_pos[1])
-            case 'C':
-                coins += 1
-                level[pos[1]][pos[0]] = '-'
-                pos = (new_pos[0], new_pos[1])
-                level[pos[1]][pos[0]] = '.'
-            case '#':
-                ... #Do not assign the new position, this is a wall
-            case '-':
-                ... #Do not assign the new position, this is the tron trail
-            case _:
-                ... # Should not happen
-
+    coins = load_and_run(trail=True)
     print(f"Amongst my path into the Maze I've collected {coins} coins.")
 
 
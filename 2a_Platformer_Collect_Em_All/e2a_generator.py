@@ -20,29 +20,29 @@ from typing import List, Tuple, Optional, Iterable
 from collections import deque
 
 
-Tile = str
-Grid = List[List[Tile]]
+Tile = int
+Grid = List[bytearray]  # one bytearray per row, 1 byte per cell
 Pos = Tuple[int, int]
 
+EMPTY = ord(".")
+WALL = ord("#")
+COIN = ord("C")
+PLAYER = ord("P")
+
 
 # -------------------------------
 # Grid helpers
 # -------------------------------
 def make_empty_grid(rows: int, cols: int) -> Grid:
-    grid: Grid = []
-    for _ in range(rows):
-        grid.append(["."] * cols)
-    return grid
+    return [bytearray(b"." * cols) for _ in range(rows)]
 
 
 def add_border_walls(grid: Grid) -> None:
     rows, cols = len(grid), len(grid[0])
-    for c in range(cols):
-        grid[0][c] = "#"
-        grid[rows - 1][c] = "#"
-    for r in range(rows):
-        grid[r][0] = "#"
-        grid[r][cols - 1] = "#"
+    grid[0][:] = b"#" * cols
+    grid[rows - 1][:] = b"#" * cols
+    for row in grid:
+        row[0] = row[cols - 1] = WALL
 
 
 def place_player(grid: Grid, rng: random.Random) -> Pos:
@@ -51,8 +51,8 @@ def place_player(grid: Grid, rng: random.Random) -> Pos:
     while True:
         r = rng.randint(1, rows - 2)
         c = rng.randint(1, cols - 2)
-        if grid[r][c] == ".":
-            grid[r][c] = "P"
+        if grid[r][c] == EMPTY:
+            grid[r][c] = PLAYER
             return (r, c)
         attempts += 1
         if attempts > 10_000:
@@ -76,18 +76,18 @@ def sprinkle_tiles(
             if (r, c) in forbidden:
                 continue
             # Only modify if currently empty
-            if grid[r][c] != ".":
+            if grid[r][c] != EMPTY:
                 continue
             x = rng.random()
             if x < wall_ratio:
-                grid[r][c] = "#"
+                grid[r][c] = WALL
             elif x < wall_ratio + coin_ratio:
-                grid[r][c] = "C"
+                grid[r][c] = COIN
             # else leave as "."
 
 
 def count_coins(grid: Grid) -> int:
-    return sum(ch == "C" for row in grid for ch in row)
+    return sum(row.count(COIN) for row in grid)
 
 
 def neighbors4(grid: Grid, r: int, c: int) -> List[Pos]:
@@ -99,50 +99,56 @@ def neighbors4(grid: Grid, r: int, c: int) -> List[Pos]:
     return out
 
 
-def bfs_reachable_from(grid: Grid, start: Pos) -> set:
-    q: deque[Pos] = deque([start])
-    seen = {start}
-    while q:
-        r, c = q.popleft()
-        for nr, nc in neighbors4(grid, r, c):
-            if (nr, nc) in seen:
-                continue
-            if grid[nr][nc] == "#":
-                continue
-            seen.add((nr, nc))
-            q.append((nr, nc))
-    return seen
-
-
 def ensure_all_coins_reachable(grid: Grid, start: Pos, rng: random.Random, max_passes: int = 20_000) -> None:
     """If a coin is unreachable, randomly knock down walls along a naive approach:
-    repeatedly open a random interior wall adjacent to any reachable cell until all coins are reachable
+    repeatedly open a random interior wall adjacent to the reachable region until all coins are reachable
     or we hit a pass limit.
+    The reachable region and its wall frontier are grown incrementally from each opened wall,
+    so every cell is explored once instead of re-running a full BFS per knocked wall.
     """
     rows, cols = len(grid), len(grid[0])
-    passes = 0
-    while True:
-        reachable = bfs_reachable_from(grid, start)
-        # Collect all coin positions
-        coins = [(r, c) for r in range(rows) for c in range(cols) if grid[r][c] == "C"]
-        if all(pos in reachable for pos in coins):
-            return  # all reachable
-        # Find candidate walls touching the reachable region to knock down
-        candidates: List[Pos] = []
-        for r, c in reachable:
+    missing = {(r, c) for r in range(rows) for c in range(cols) if grid[r][c] == COIN}
+    reachable: set = set()
+
+    # Interior walls touching the reachable region, list + index for O(1) random pick and removal
+    frontier: List[Pos] = []
+    frontier_index: dict = {}
+
+    def grow(seed: Pos) -> None:
+        q: deque[Pos] = deque([seed])
+        reachable.add(seed)
+        missing.discard(seed)
+        while q:
+            r, c = q.popleft()
             for nr, nc in neighbors4(grid, r, c):
-                if 0 < nr < rows - 1 and 0 < nc < cols - 1 and grid[nr][nc] == "#":
-                    candidates.append((nr, nc))
-        if not candidates:
-            # fallback: open a random interior wall
-            interior_walls = [(r, c) for r in range(1, rows - 1) for c in range(1, cols - 1) if grid[r][c] == "#"]
-            if not interior_walls:
-                return
-            r, c = rng.choice(interior_walls)
-            grid[r][c] = "."
-        else:
-            r, c = rng.choice(candidates)
-            grid[r][c] = "."
+                if (nr, nc) in reachable:
+                    continue
+                if grid[nr][nc] == WALL:
+                    if 0 < nr < rows - 1 and 0 < nc < cols - 1 and (nr, nc) not in frontier_index:
+                        frontier_index[(nr, nc)] = len(frontier)
+                        frontier.append((nr, nc))
+                    continue
+                reachable.add((nr, nc))
+                missing.discard((nr, nc))
+                q.append((nr, nc))
+
+    grow(start)
+    passes = 0
+    while missing:
+        if not frontier:
+            # Only border walls around the region left: nothing more can be opened
+            return
+
+        wall = rng.choice(frontier)
+        idx = frontier_index.pop(wall)
+        last = frontier.pop()
+        if idx < len(frontier):
+            frontier[idx] = last
+            frontier_index[last] = idx
+
+        grid[wall[0]][wall[1]] = EMPTY
+        grow(wall)
+
         passes += 1
         if passes > max_passes:
             # Give up; level stays as-is (rare for reasonable ratios)
@@ -159,17 +165,22 @@ DIRS = {
     "R": (0, 1),
 }
 DIR_LIST = ["U", "D", "L", "R"]
+OPPOSITE = {"U": "D", "D": "U", "L": "R", "R": "L"}
+
+# Fixed preference orders per last direction, built once instead of at every step
+BACKTRACK_ORDER = {d: [OPPOSITE[d]] + [o for o in DIR_LIST if o != OPPOSITE[d]] for d in DIR_LIST}
+FORWARD_ORDER = {d: [d] + [o for o in DIR_LIST if o != d] for d in DIR_LIST}
 
 
 def legal(grid: Grid, r: int, c: int) -> bool:
-    return 0 <= r < len(grid) and 0 <= c < len(grid[0]) and grid[r][c] != "#"
+    return 0 <= r < len(grid) and 0 <= c < len(grid[0]) and grid[r][c] != WALL
 
 
 def find_player(grid: Grid) -> Pos:
     for r, row in enumerate(grid):
-        for c, ch in enumerate(row):
-            if ch == "P":
-                return (r, c)
+        c = row.find(PLAYER)
+        if c != -1:
+            return (r, c)
 
     raise ValueError("No 'P' in grid")
 
@@ -186,39 +197,36 @@ def generate_moves_random_walk(
     - if next step is illegal, pick a random legal direction
     """
     r, c = find_player(grid)
+    rows, cols = len(grid), len(grid[0])
     moves: List[str] = []
     last_dir: Optional[str] = None
 
-    for _ in range(n_moves):
-        candidates = list(DIR_LIST)
+    def is_legal(nr: int, nc: int) -> bool:
+        return 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] != WALL
 
+    for _ in range(n_moves):
         if last_dir and rng.random() < bias_backtrack:
             # occasionally backtrack for variety
-            back = {"U": "D", "D": "U", "L": "R", "R": "L"}[last_dir]
-            preferred_order = [back] + [d for d in DIR_LIST if d != back]
+            preferred_order = BACKTRACK_ORDER[last_dir]
         elif last_dir and rng.random() < 0.55:
             # often keep moving forward
-            preferred_order = [last_dir] + [d for d in DIR_LIST if d != last_dir]
+            preferred_order = FORWARD_ORDER[last_dir]
         else:
-            rng.shuffle(candidates)
-            preferred_order = candidates
+            preferred_order = list(DIR_LIST)
+            rng.shuffle(preferred_order)
 
         chosen = None
         for d in preferred_order:
             dr, dc = DIRS[d]
             nr, nc = r + dr, c + dc
-            if legal(grid, nr, nc):
+            if is_legal(nr, nc):
                 chosen = d
                 r, c = nr, nc
                 break
 
         if chosen is None:
             # stuck? choose any legal neighbor; if none, stay put by repeating last_dir or 'U'
-            legal_dirs = []
-            for d in DIR_LIST:
-                dr, dc = DIRS[d]
-                if legal(grid, r + dr, c + dc):
-                    legal_dirs.append(d)
+            legal_dirs = [d for d in DIR_LIST if is_legal(r + DIRS[d][0], c + DIRS[d][1])]
             if legal_dirs:
                 chosen = rng.choice(legal_dirs)
                 dr, dc = DIRS[chosen]
@@ -238,7 +246,7 @@ def generate_moves_random_walk(
 def write_grid(path: str, grid: Grid) -> None:
     with open(path, "w", encoding="utf-8") as f:
         for row in grid:
-            f.write("".join(row) + "\n")
+            f.write(row.decode("ascii") + "\n")
 
 
 def write_moves(path: str, moves: List[str]) -> None:
@@ -265,9 +273,9 @@ def generate_level(
 
     # Temporarily place P to reserve a spot, then sprinkle tiles avoiding that spot
     pr, pc = rows // 2, cols // 2  # center-ish
-    if grid[pr][pc] == "#":
+    if grid[pr][pc] == WALL:
         pr, pc = pr - 1, pc - 1
-    grid[pr][pc] = "P"
+    grid[pr][pc] = PLAYER
 
     sprinkle_tiles(grid, rng, coin_ratio=coin_ratio, wall_ratio=wall_ratio, forbid_positions=[(pr, pc)])
 
@@ -276,8 +284,8 @@ def generate_level(
         ensure_all_coins_reachable(grid, (pr, pc), rng=rng)
 
     # If P was accidentally boxed in (rare), relocate to a random empty interior
-    if not any(grid[nr][nc] != "#" for nr, nc in neighbors4(grid, pr, pc)):
-        grid[pr][pc] = "."
+    if not any(grid[nr][nc] != WALL for nr, nc in neighbors4(grid, pr, pc)):
+        grid[pr][pc] = EMPTY
         place_player(grid, rng)
 
     return grid
@@ -1,28 +1,44 @@
 
+# '#' -> 1 (solid), every other tile -> 0
+_WALL_TABLE = bytes(1 if b == ord("#") else 0 for b in range(256))
+
+
 class SonicMap:
     def __init__(self, mapFile):
         self.grid = self.load_map_lines(mapFile)
         self.nb_rows: int = len(self.grid)
         self.nb_cols: int = len(self.grid[0]) if self.nb_rows else 0
 
+        # Solid flags with a 1-cell solid border, flat and indexed by (row + 1) * stride + (col + 1)
+        self.stride: int = self.nb_cols + 2
+        self.wall: bytes = self.build_wall_table(self.grid, self.nb_rows, self.nb_cols)
+
     @staticmethod
     def load_map_lines(filename) -> list[str]:
         with open(filename, "r") as f:
             return [line.rstrip("\n") for line in f]
 
-    def find_start(self):
-        sp = [[float(c), float(r)] for r, row in enumerate(self.grid) for c, ch in enumerate(row) if ch == "S"]
+    @staticmethod
+    def build_wall_table(grid: list[str], nb_rows: int, nb_cols: int) -> bytes:
+        stride = nb_cols + 2
+        wall = bytearray(b"\x01") * ((nb_rows + 2) * stride)
+        for r, row in enumerate(grid):
+            start = (r + 1) * stride + 1
+            wall[start:start + nb_cols] = row.encode().ljust(nb_cols, b"#")[:nb_cols].translate(_WALL_TABLE)
+        return bytes(wall)
 
-        if len(sp) != 1:
+    def find_start(self):
+        if sum(row.count("S") for row in self.grid) != 1:
             raise ValueError("Grid must contains 1 and only 1 'S'")
 
-        return sp[0]
+        for r, row in enumerate(self.grid):
+            c = row.find("S")
+            if c != -1:
+                return [float(c), float(r)]
 
     def is_wall(self, row: int, col: int) -> bool:
         """Out-of-bounds = solid, '#' = solid, 'S' is actually empty."""
-        if row < 0 or row >= self.nb_rows or col < 0 or col >= self.nb_cols:
+        if row < -1 or row > self.nb_rows or col < -1 or col > self.nb_cols:
             return True
 
-        ch = self.grid[row][col]
-        return ch == "#"
-
+        return self.wall[(row + 1) * self.stride + col + 1] == 1
@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from math import floor
 from SonicMap import SonicMap
 # ---------------------- Constantes physiques & rendu ----------------------
@@ -7,6 +9,128 @@ VX_MAX = 0.5
 VY_UP_MAX = 0.6    # TOWARDS Up (negative vertical speed)
 VY_DOWN_MAX = 0.8  # Towards down (positive vertical speed)
 
+# Lower clamp bounds, negated once here instead of on every tick
+VX_MIN = -VX_MAX
+VY_UP_MIN = -VY_UP_MAX
+
+# ---------------------- Command codes ----------------------
+CMD_WAIT = 0
+CMD_JUMP = 1
+CMD_RIGHT = 2
+CMD_LEFT = 3
+
+COMMAND_CODES = {"WAIT": CMD_WAIT, "JUMP": CMD_JUMP, "RIGHT": CMD_RIGHT, "LEFT": CMD_LEFT}
+
+
+def step(x: float, y: float, vx: float, vy: float, on_ground: bool,
+         wall: bytes, stride: int, cmd: int, val: float) -> tuple[float, float, float, float, bool]:
+    """
+    One physics tick on plain values: command impulse, gravity, friction, clamps, then
+    movement on X and Y with collisions against the padded wall table of SonicMap.
+    Speeds stay below one cell per tick, so the tested cell is never further than the solid border.
+    Returns the new (x, y, vx, vy, on_ground).
+    """
+    # 1) Command impulse
+    if cmd == CMD_JUMP:
+        if on_ground:
+            vy -= val
+    elif cmd == CMD_RIGHT:
+        vx += val
+    elif cmd == CMD_LEFT:
+        vx -= val
+
+    # 2) Gravity
+    vy += G
+
+    # 3) Friction
+    vx *= FRICTION
+
+    # 4) Clamps, as plain compares rather than min()/max() calls
+    if vx > VX_MAX:
+        vx = VX_MAX
+    elif vx < VX_MIN:
+        vx = VX_MIN
+
+    if vy > VY_DOWN_MAX:
+        vy = VY_DOWN_MAX
+    elif vy < VY_UP_MIN:
+        vy = VY_UP_MIN
+
+    # 5) Movement on the X axis
+    new_x = x + vx
+    test_col = floor(new_x)
+    test_row = floor(y)
+
+    if wall[(test_row + 1) * stride + test_col + 1]:
+        # blocked : Realign just before the position
+        if vx > 0:
+            # Coming from the left -> realign before the wall
+            x = test_col - 1e-6
+        elif vx < 0:
+            # Coming from the left -> realign a tiny bit after the wall
+            x = test_col + 1 + 1e-6
+        vx = 0.0
+    else:
+        x = new_x
+
+    # 6) Then on the Y axis (a bit different)
+    new_y = y + vy
+    test_row = floor(new_y)
+    test_col = floor(x)
+    on_ground = False
+
+    if wall[(test_row + 1) * stride + test_col + 1]:
+        if vy > 0:
+            # Coming from above on the platform, we set on_ground and stop
+            y = test_row - 1e-6
+            vy = 0.0
+            on_ground = True
+        elif vy < 0:
+            # Hit a ceiling
+            y = test_row + 1 + 1e-6
+            vy = 0.0
+    else:
+        y = new_y
+
+    return x, y, vx, vy, on_ground
+
+
+def encode_command(command) -> tuple[int, float]:
+    """Split command line (e.g. ["RIGHT", "1.60"]) -> (command code, value) as expected by step()."""
+    cmd = COMMAND_CODES.get(command[0], CMD_WAIT)
+    return cmd, (float(command[1]) if cmd != CMD_WAIT else 0.0)
+
+
+def simulate(encoded: list[tuple[int, float]], wall: bytes, stride: int, x: float, y: float) -> tuple[float, float, float]:
+    """
+    Run a whole encoded command sequence, starting at rest from (x, y).
+    Returns (final_x, final_y, highest_y), highest_y being the smallest y reached (row 0 is the top).
+    """
+    vx = vy = 0.0
+    on_ground = False
+    highest_y = y
+    for cmd, val in encoded:
+        x, y, vx, vy, on_ground = step(x, y, vx, vy, on_ground, wall, stride, cmd, val)
+        if y < highest_y:
+            highest_y = y
+
+    return x, y, highest_y
+
+
+def simulate_many(command_batches, sonic_map: SonicMap, max_workers: int | None = None) -> list[tuple[float, float, float]]:
+    """
+    Simulate many independent command sequences (e.g. when searching for the best inputs), each one
+    from the map spawn, spread over worker processes. Results follow the order of command_batches.
+    Call it under `if __name__ == "__main__":` since workers re-import the main module on some platforms.
+    """
+    start_x, start_y = sonic_map.find_start()
+    encoded = [[encode_command(command) for command in commands] for commands in command_batches]
+    run = partial(simulate, wall=sonic_map.wall, stride=sonic_map.stride, x=start_x, y=start_y)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(run, encoded, chunksize=16))
+
+
 class SonicPlayer:
     def __init__(self, sonic_map:SonicMap) -> None:
         start_pos = sonic_map.find_start()
@@ -18,75 +142,17 @@ class SonicPlayer:
         self.vy: float = 0.0
         self.on_ground: bool = False
 
-    @staticmethod
-    def _clamp(v: float, lo: float, hi: float) -> float:
-        return max(lo, min(hi, v))
-
-    def _move_horizontal(self) -> None:
-        new_x = self.x + self.vx
-        test_col = int(floor(new_x))
-        test_row = int(floor(self.y))
-
-        if self.map.is_wall(test_row, test_col):
-            # blocked : Realign just before the position
-            if self.vx > 0:
-                # Coming from the left -> realign before the wall
-                self.x = floor(new_x) - 1e-6
-
-            elif self.vx < 0:
-                # Coming from the left -> realign a tiny bit after the wall
-                self.x = floor(new_x) + 1 + 1e-6
-
-            self.vx = 0.0
-        else:
-            self.x = new_x
-
-    def _move_vertical(self) -> None:
-        new_y = self.y + self.vy
-        test_row = int(floor(new_y))
-        test_col = int(floor(self.x))
-        self.on_ground = False
-
-        if self.map.is_wall(test_row, test_col):
-            if self.vy > 0:
-                # Coming from above on the platform, we set on_ground and stop
-                self.y = floor(new_y) - 1e-6
-                self.vy = 0.0
-                self.on_ground = True
-
-            elif self.vy < 0:
-                # Hit a ceiling
-                self.y = floor(new_y) + 1 + 1e-6
-                self.vy = 0.0
-        else:
-            self.y = new_y
-
     def manage(self, command):
-        match command[0]:
-            case "WAIT":
-                ...
-            case "JUMP":
-                if self.on_ground:
-                    self.vy -= float(command[1])
-            case "RIGHT":
-                self.vx += float(command[1])
-            case "LEFT":
-                self.vx -= float(command[1])
-
-        # 2) Gravity
-        self.vy += G
-
-        # 3) Friction
-        self.vx *= FRICTION
-
-        # 4) Clamps
-        self.vx = self._clamp(self.vx, -VX_MAX, VX_MAX)
-        self.vy = self._clamp(self.vy, -VY_UP_MAX, VY_DOWN_MAX)
-
-        # 5) Movement on the X axis, then on the Y axis (a bit different for both)
-        self._move_horizontal()
-        self._move_vertical()
+        self.apply(*encode_command(command))
 
-    def print_debug(self):
-        print(f"pos=({self.x:.2f},{self.y:.2f})  vel=({self.vx:.2f},{self.vy:.2f}),on_ground={self.on_ground} ")
+    def apply(self, cmd: int, val: float):
+        """Same as manage() for a command already encoded with encode_command()."""
+        self.x, self.y, self.vx, self.vy, self.on_ground = step(
+            self.x, self.y, self.vx, self.vy, self.on_ground,
+            self.map.wall, self.map.stride, cmd, val)
+
+    def debug_line(self) -> str:
+        return f"pos=({self.x:.2f},{self.y:.2f})  vel=({self.vx:.2f},{self.vy:.2f}),on_ground={self.on_ground} "
 
+    def print_debug(self):
+        print(self.debug_line())
@@ -1,6 +1,7 @@
 import math
+from functools import lru_cache
 from math import floor
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import pygame
 
 
@@ -17,6 +18,122 @@ VY_DOWN_MAX = 0.8  # vers le bas (vy positif)
 BG_COLOR = (10, 10, 12)
 TILE_COLOR = (60, 60, 60)
 SPAWN_COLOR = (30, 144, 255)
+HUD_COLOR = (235, 235, 210)
+
+# Table de traduction octet -> 1 si solide ('#'), 0 sinon
+_SOLID_TABLE = bytes(1 if b == ord("#") else 0 for b in range(256))
+
+# Piquants du hérisson : (cos, sin) de l'angle et des deux flancs à ±0.2 rad
+_SPIKES = 10
+_SPIKE_TRIG = [
+    (math.cos(a), math.sin(a), math.cos(a + 0.2), math.sin(a + 0.2), math.cos(a - 0.2), math.sin(a - 0.2))
+    for a in ((2 * math.pi * i) / _SPIKES for i in range(_SPIKES))
+]
+
+
+def tile_runs(row: str, ch: str) -> List[Tuple[int, int]]:
+    """Plages horizontales contiguës de `ch` dans une ligne : [(colonne début, longueur), ...]."""
+    runs = []
+    start = row.find(ch)
+    while start != -1:
+        end = start + 1
+        while end < len(row) and row[end] == ch:
+            end += 1
+        runs.append((start, end - start))
+        start = row.find(ch, end)
+    return runs
+
+
+@lru_cache(maxsize=512)
+def _render_hud_line(font: pygame.font.Font, text: str) -> pygame.Surface:
+    """Rasterise une ligne de HUD ; les lignes identiques d'une frame à l'autre sont réutilisées."""
+    return font.render(text, True, HUD_COLOR)
+
+
+# ---------------------- Noyau physique ----------------------
+OP_WAIT = 0
+OP_LEFT = 1
+OP_RIGHT = 2
+OP_JUMP = 3
+
+_OP_CODES = {"WAIT": OP_WAIT, "LEFT": OP_LEFT, "RIGHT": OP_RIGHT, "JUMP": OP_JUMP}
+
+
+def step(solid: bytes, rows: int, cols: int,
+         x: float, y: float, vx: float, vy: float, on_ground: bool,
+         op: int, val: Optional[float]) -> Tuple[float, float, float, float, bool, Optional[int]]:
+    """
+    Une frame de physique sur des valeurs simples (sans attributs d'instance) :
+    impulsion, gravité, friction, clamps puis déplacement X puis Y avec collisions.
+    `solid` est la carte aplatie de SonicGame (1 = solide), hors-bord = solide.
+    Retourne (x, y, vx, vy, on_ground, landed_row) ; landed_row vaut None sans atterrissage.
+    """
+    # 1) Impulsions de la commande
+    if op == OP_LEFT:
+        vx -= val
+    elif op == OP_RIGHT:
+        vx += val
+    elif op == OP_JUMP:
+        if on_ground:
+            vy -= val
+    # WAIT => rien
+
+    # 2) Gravité
+    vy += G
+
+    # 3) Friction
+    vx *= FRICTION
+
+    # 4) Clamps
+    if vx > VX_MAX:
+        vx = VX_MAX
+    elif vx < -VX_MAX:
+        vx = -VX_MAX
+    if vy > VY_DOWN_MAX:
+        vy = VY_DOWN_MAX
+    elif vy < -VY_UP_MAX:
+        vy = -VY_UP_MAX
+
+    # 5) Déplacement axe X (point dans grille avec floor)
+    new_x = x + vx
+    test_col = floor(new_x)
+    test_row = floor(y)
+
+    if not (0 <= test_row < rows and 0 <= test_col < cols) or solid[test_row * cols + test_col]:
+        # bloqué : s'aligner au bord selon la direction
+        if vx > 0:
+            # venant de la gauche → placer juste avant le mur
+            x = test_col - 1e-6
+        elif vx < 0:
+            # venant de la droite
+            x = test_col + 1 + 1e-6
+        vx = 0.0
+    else:
+        x = new_x
+
+    # 6) Puis axe Y
+    new_y = y + vy
+    test_row = floor(new_y)
+    test_col = floor(x)
+    on_ground = False
+    landed_row = None
+
+    if not (0 <= test_row < rows and 0 <= test_col < cols) or solid[test_row * cols + test_col]:
+        if vy > 0:
+            # on tombe sur une plateforme : se poser dessus
+            y = test_row - 1e-6
+            vy = 0.0
+            on_ground = True
+            landed_row = test_row
+        elif vy < 0:
+            # on cogne un plafond
+            y = test_row + 1 + 1e-6
+            vy = 0.0
+    else:
+        y = new_y
+
+    return x, y, vx, vy, on_ground, landed_row
+
 
 # ---------------------- Classe principale ----------------------
 
@@ -30,6 +147,9 @@ class SonicGame:
                       déplace avec collisions et mémorise l'atterrissage max
       - draw(surface) : rend la carte et un hérisson procédural
     """
+    # Sprites du hérisson déjà rendus, par échelle : scale -> (surface, demi-taille)
+    _HEDGEHOG_CACHE: Dict[int, Tuple[pygame.Surface, int]] = {}
+
     def __init__(self, grid_lines: List[str], view_scale: int = TILE) -> None:
         # Carte / dimensions
         self.grid: List[str] = grid_lines[:]  # immuable ici
@@ -41,13 +161,15 @@ class SonicGame:
             if len(line) != self.cols:
                 raise ValueError("La carte doit être rectangulaire.")
 
-        # Localiser le spawn 'S'
-        sp = [(r, c) for r, row in enumerate(self.grid) for c, ch in enumerate(row) if ch == "S"]
-        if len(sp) != 1:
+        # Localiser le spawn 'S' (comptage puis recherche via les méthodes natives de str)
+        if sum(row.count("S") for row in self.grid) != 1:
             raise ValueError("La carte doit contenir exactement un 'S'.")
 
-        self.spawn_row: int = sp[0][0]
-        self.spawn_col: int = sp[0][1]
+        self.spawn_row: int = next(r for r, row in enumerate(self.grid) if "S" in row)
+        self.spawn_col: int = self.grid[self.spawn_row].index("S")
+
+        # Carte solide aplatie (1 octet par case), construite une seule fois
+        self.solid: bytes = "".join(self.grid).encode("ascii").translate(_SOLID_TABLE)
 
         # État joueur (positions en float)
         self.x: float = float(self.spawn_col)
@@ -63,15 +185,17 @@ class SonicGame:
         # Rendu
         self.scale: int = view_scale  # pixels par tuile
         self.hud_font: Optional[pygame.font.Font] = None
+        self._map_surface: Optional[pygame.Surface] = None  # couche statique, rendue au 1er draw
 
-    # ---- Collision helpers ----
-    def _is_solid(self, row: int, col: int) -> bool:
-        """Hors-bord = solide, '#' = solide, 'S' traité comme air."""
-        if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
-            return True
-
-        ch = self.grid[row][col]
-        return ch == "#"
+        # Rectangles des tuiles à dessiner, calculés une fois (la carte ne bouge pas) :
+        # une plage horizontale de tuiles identiques = un seul rectangle
+        s = self.scale
+        self._tile_rects: List[Tuple[int, int, int, int]] = [
+            (c * s, r * s, n * s, s) for r, row in enumerate(self.grid) for c, n in tile_runs(row, "#")
+        ]
+        self._spawn_rects: List[Tuple[int, int, int, int]] = [
+            (c * s, r * s, n * s, s) for r, row in enumerate(self.grid) for c, n in tile_runs(row, "S")
+        ]
 
     @staticmethod
     def _parse_command(s: str) -> Tuple[str, Optional[float]]:
@@ -85,10 +209,6 @@ class SonicGame:
 
         return op, val
 
-    @staticmethod
-    def _clamp(v: float, lo: float, hi: float) -> float:
-        return max(lo, min(hi, v))
-
     # ---- Physique par frame ----
     def manage(self, command: Optional[str]) -> None:
         """
@@ -98,69 +218,15 @@ class SonicGame:
         op, val = self._parse_command(command)
         self.last_cmd = op if (op == "WAIT" or val is None) else f"{op} {val:.2f}"
 
-        # 1) Impulsions de la commande
-        if op == "LEFT" and val is not None:
-            self.vx -= val
-        elif op == "RIGHT" and val is not None:
-            self.vx += val
-        elif op == "JUMP" and val is not None:
-            if self.on_ground:
-                self.vy -= val
-        # WAIT => rien
-
-        # 2) Gravité
-        self.vy += G
-
-        # 3) Friction
-        self.vx *= FRICTION
-
-        # 4) Clamps
-        self.vx = self._clamp(self.vx, -VX_MAX, VX_MAX)
-        self.vy = self._clamp(self.vy, -VY_UP_MAX, VY_DOWN_MAX)
-
-        # 5) Déplacement axe X puis Y (point dans grille avec floor)
-        self._move_horizontal()
-        self._move_vertical()
-
-    def _move_horizontal(self) -> None:
-        new_x = self.x + self.vx
-        test_col = int(floor(new_x))
-        test_row = int(floor(self.y))
-
-        if self._is_solid(test_row, test_col):
-            # bloqué : s'aligner au bord selon la direction
-            if self.vx > 0:
-                # venant de la gauche → placer juste avant le mur
-                self.x = floor(new_x) - 1e-6
-            elif self.vx < 0:
-                # venant de la droite
-                self.x = floor(new_x) + 1 + 1e-6
-            self.vx = 0.0
-        else:
-            self.x = new_x
-
-    def _move_vertical(self) -> None:
-        new_y = self.y + self.vy
-        test_row = int(floor(new_y))
-        test_col = int(floor(self.x))
-        self.on_ground = False
-
-        if self._is_solid(test_row, test_col):
-            if self.vy > 0:
-                # on tombe sur une plateforme : se poser dessus
-                self.y = floor(new_y) - 1e-6
-                self.vy = 0.0
-                self.on_ground = True
-                landed_row = int(floor(new_y))
-                if (self.highest_platform_row_landed is None or
-                        landed_row < self.highest_platform_row_landed):
-                    self.highest_platform_row_landed = landed_row
-            elif self.vy < 0:
-                # on cogne un plafond
-                self.y = floor(new_y) + 1 + 1e-6
-                self.vy = 0.0
-        else:
-            self.y = new_y
+        # Sans valeur, une commande n'a pas d'impulsion (comme WAIT)
+        op_code = OP_WAIT if val is None else _OP_CODES.get(op, OP_WAIT)
+        self.x, self.y, self.vx, self.vy, self.on_ground, landed_row = step(
+            self.solid, self.rows, self.cols,
+            self.x, self.y, self.vx, self.vy, self.on_ground, op_code, val)
+
+        if landed_row is not None and (self.highest_platform_row_landed is None or
+                                       landed_row < self.highest_platform_row_landed):
+            self.highest_platform_row_landed = landed_row
 
     # ---- Rendu ----
     def draw(self, surface: pygame.Surface) -> None:
@@ -168,27 +234,18 @@ class SonicGame:
         if self.hud_font is None:
             self.hud_font = pygame.font.SysFont("consolas", 16)
 
-        # fond
-        surface.fill(BG_COLOR)
+        if self._map_surface is None:
+            self._map_surface = self._render_map()
 
-        # tuiles
-        for r, row in enumerate(self.grid):
-            for c, ch in enumerate(row):
-                if ch == "#":
-                    pygame.draw.rect(
-                        surface, TILE_COLOR,
-                        (c * self.scale, r * self.scale, self.scale, self.scale)
-                    )
-                elif ch == "S":
-                    pygame.draw.rect(
-                        surface, SPAWN_COLOR,
-                        (c * self.scale, r * self.scale, self.scale, self.scale)
-                    )
+        # fond + tuiles (un seul blit de la couche statique)
+        surface.fill(BG_COLOR)
+        surface.blit(self._map_surface, (0, 0))
 
         # hérisson procédural (petit sprite vectoriel)
         px = int(self.x * self.scale)
         py = int((self.y - 0.5) * self.scale)
-        self._draw_hedgehog(surface, px, py, self.scale)
+        sprite, half = self._hedgehog_sprite(self.scale)
+        surface.blit(sprite, (px - half, py - half))
 
         # HUD
         text_lines = [
@@ -198,11 +255,35 @@ class SonicGame:
         ]
         y0 = 400
         for s in text_lines:
-            img = self.hud_font.render(s, True, (235, 235, 210))
+            img = _render_hud_line(self.hud_font, s)
             surface.blit(img, (8, y0))
             y0 += img.get_height() + 2
 
-    def _draw_hedgehog(self, surf: pygame.Surface, cx: int, cy: int, scale: int) -> None:
+    def _render_map(self) -> pygame.Surface:
+        """Rend une fois la carte (fond + tuiles) sur une surface hors écran."""
+        map_surface = pygame.Surface((self.cols * self.scale, self.rows * self.scale))
+        map_surface.fill(BG_COLOR)
+        for rect in self._tile_rects:
+            map_surface.fill(TILE_COLOR, rect)
+        for rect in self._spawn_rects:
+            map_surface.fill(SPAWN_COLOR, rect)
+        return map_surface
+
+    @classmethod
+    def _hedgehog_sprite(cls, scale: int) -> Tuple[pygame.Surface, int]:
+        """Rend le hérisson une seule fois par échelle sur une surface transparente."""
+        cached = cls._HEDGEHOG_CACHE.get(scale)
+        if cached is None:
+            body = max(int(scale * 0.9), int(scale * 0.7))
+            # rayon des piquants + marge (le museau a un rayon minimal de 2 px)
+            half = body // 2 + 2 * int(scale * 0.2) + max(2, scale // 8) + 4
+            sprite = pygame.Surface((2 * half + 1, 2 * half + 1), pygame.SRCALPHA)
+            cls._draw_hedgehog(sprite, half, half, scale)
+            cached = cls._HEDGEHOG_CACHE[scale] = (sprite, half)
+        return cached
+
+    @staticmethod
+    def _draw_hedgehog(surf: pygame.Surface, cx: int, cy: int, scale: int) -> None:
         """
         Hérisson minimaliste :
           - corps ellipsoïdal brun
@@ -217,16 +298,14 @@ class SonicGame:
         spike_color = (90, 45, 10)
 
         # Piquants (anneau de triangles)
-        spikes = 10
         radius = max(body_w, body_h) // 2 + int(scale * 0.2)
-        for i in range(spikes):
-            ang = (2 * math.pi * i) / spikes
-            x1 = cx + int(math.cos(ang) * (radius - 2))
-            y1 = cy + int(math.sin(ang) * (radius - 2))
-            x2 = cx + int(math.cos(ang + 0.2) * (radius + scale * 0.2))
-            y2 = cy + int(math.sin(ang + 0.2) * (radius + scale * 0.2))
-            x3 = cx + int(math.cos(ang - 0.2) * (radius + scale * 0.2))
-            y3 = cy + int(math.sin(ang - 0.2) * (radius + scale * 0.2))
+        for ca, sa, cl, sl, cr, sr in _SPIKE_TRIG:
+            x1 = cx + int(ca * (radius - 2))
+            y1 = cy + int(sa * (radius - 2))
+            x2 = cx + int(cl * (radius + scale * 0.2))
+            y2 = cy + int(sl * (radius + scale * 0.2))
+            x3 = cx + int(cr * (radius + scale * 0.2))
+            y3 = cy + int(sr * (radius + scale * 0.2))
             pygame.draw.polygon(surf, spike_color, [(x1, y1), (x2, y2), (x3, y3)])
 
         # Corps
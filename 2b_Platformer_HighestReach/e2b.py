@@ -1,24 +1,58 @@
-from time import sleep
-from SonicPlayer import SonicPlayer
+import argparse
+import os
+import sys
+from array import array
+from SonicPlayer import SonicPlayer, encode_command, simulate
 from SonicMap import SonicMap
 
 
 
 def load_commands(filename):
+    """
+    Read and encode every command once -> list of (command code, value).
+    Uses the pre-encoded commands.bin written by e2b_generator when it is not older than the text file.
+    """
+    bin_file = os.path.splitext(filename)[0] + ".bin"
+    if os.path.exists(bin_file) and os.path.getmtime(bin_file) >= os.path.getmtime(filename):
+        return load_command_bin(bin_file)
+
     with open(filename, "r") as f:
-        return [line.rstrip("\n").split() for line in f]
+        return [encode_command(line.split()) for line in f]
+
+
+def load_command_bin(filename):
+    """Inverse of e2b_generator.write_command_bin: N signed-byte codes then N doubles."""
+    with open(filename, "rb") as f:
+        data = f.read()
+
+    count = len(data) // 9  # 1 byte code + 8 bytes value per frame
+    cmds, vals = array("b"), array("d")
+    cmds.frombytes(data[:count])
+    vals.frombytes(data[count:count * 9])
+    return list(zip(cmds, vals))
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Replay the command stream on the map.")
+    parser.add_argument("--quiet", action="store_true", help="Only print the final position (no per-frame trace)")
+    args = parser.parse_args()
+
     sonic_map = SonicMap("data/map.txt")
     player = SonicPlayer(sonic_map)
 
     commands = load_commands("data/commands.txt")
 
-    for command in commands:
-        player.manage(command)
-        player.print_debug()
-        sleep(0.01)
+    if args.quiet:
+        # Whole stream in one call, no per-frame state to report
+        player.x, player.y, _ = simulate(commands, sonic_map.wall, sonic_map.stride, player.x, player.y)
+    else:
+        # Per-frame trace buffered and written once, instead of one print per frame
+        trace = []
+        for cmd, val in commands:
+            player.apply(cmd, val)
+            trace.append(player.debug_line())
+        if trace:
+            sys.stdout.write("\n".join(trace) + "\n")
 
     print(f" Last position of Sonic=({player.x:.2f},{player.y:.2f})")
 
@@ -6,6 +6,7 @@ Generates:
   - map.txt  : grid with '#' (solid), '.' (air), 'S' (spawn)
   - commands.txt : per-frame commands at 20 FPS (default) with impulses:
         RIGHT a / LEFT a / JUMP j / WAIT
+  - commands.bin : the same stream pre-encoded for e2b.py (see write_command_bin)
 
 Design:
   - Tiles are implicitly 16x16 px (not rendered here).
@@ -20,7 +21,11 @@ Usage:
 """
 
 import argparse
+import os
 import random
+from array import array
+from itertools import accumulate
+from SonicPlayer import encode_command
 
 # ====== Command stream parameters (tuned for 20 FPS) ======
 FPS_DEFAULT = 20
@@ -28,6 +33,12 @@ RIGHT_THRUST = 1.6
 LEFT_THRUST  = 1.6
 JUMP_FORCE   = 5.0  # one-frame pulse; your sim should ignore if not on_ground
 
+# Command lines, formatted once instead of on every frame
+LINE_RIGHT = f"RIGHT {RIGHT_THRUST:.2f}"
+LINE_LEFT = f"LEFT {LEFT_THRUST:.2f}"
+LINE_JUMP = f"JUMP {JUMP_FORCE:.2f}"
+LINE_WAIT = "WAIT"
+
 RUN_MIN, RUN_MAX = 20, 80          # run motif lengths (frames)
 COAST_MIN, COAST_MAX = 10, 50      # coast motif lengths (frames)
 HOP_NEUTRAL_BEFORE = 5
@@ -42,6 +53,10 @@ MOTIF_WEIGHTS = {
     "stair_climb_intent": 0.08,
 }
 
+# Motif names and cumulative weights, computed once for rng.choices()
+_MOTIF_NAMES = tuple(MOTIF_WEIGHTS)
+_MOTIF_CUM = tuple(accumulate(MOTIF_WEIGHTS.values()))
+
 RUN_JUMP_CHANCE = 0.18
 RUN_JUMP_COOLDOWN = (FPS_DEFAULT // 2)
 
@@ -66,24 +81,24 @@ STUMP_MIN_H, STUMP_MAX_H = 1, 2
 def gen_map(width: int, height: int, ground_y: int, platforms: int, rng: random.Random) -> list[str]:
     """Generate rectangular grid with ground, low platforms, short stumps, and a spawn runway."""
     assert width >= 8 and height >= 8
-    grid = [["." for _ in range(width)] for _ in range(height)]
+    # Rows as bytearrays: whole spans are filled / tested with slices
+    grid = [bytearray(b"." * width) for _ in range(height)]
 
     # Ground
     ground_y = ground_y if 0 <= ground_y < height else height - 1
-    for c in range(width):
-        grid[ground_y][c] = "#"
+    grid[ground_y][:] = b"#" * width
 
     # ---- Short ground stumps (no tall pillars) ----
     num_stumps = max(0, width // STUMPS_PER_WIDTH)
     for _ in range(num_stumps):
         c = rng.randrange(3, width - 3)
         # Keep space from neighbors to avoid fused lumps
-        if any(grid[ground_y - 1][cc] == "#" for cc in (c - 1, c, c + 1)):
+        if b"#" in grid[ground_y - 1][c - 1:c + 2]:
             continue
         h = rng.randint(STUMP_MIN_H, STUMP_MAX_H)  # small bump 1–2 high
         for r in range(ground_y - h, ground_y):
             if 0 <= r < height:
-                grid[r][c] = "#"
+                grid[r][c] = ord("#")
 
     # ---- Dense low-altitude platforms (2–6 above ground), biased low ----
     offsets = list(range(LOW_ROW_MIN_OFFSET, LOW_ROW_MAX_OFFSET + 1))
@@ -105,11 +120,10 @@ def gen_map(width: int, height: int, ground_y: int, platforms: int, rng: random.
             return False
         if c0 < 1 or c0 + length >= width - 1:
             return False
-        for c in range(c0, c0 + length):
-            if grid[r][c] == "#":
-                return False
-            if r - 1 >= 0 and grid[r - 1][c] == "#":  # avoid ceilings directly above
-                return False
+        if b"#" in grid[r][c0:c0 + length]:
+            return False
+        if b"#" in grid[r - 1][c0:c0 + length]:  # avoid ceilings directly above (r >= 1 here)
+            return False
         return True
 
     placed_low = 0
@@ -120,8 +134,7 @@ def gen_map(width: int, height: int, ground_y: int, platforms: int, rng: random.
         seg_len = rng.randint(3, 8)
         c_start = rng.randint(1, width - seg_len - 2)
         if can_place_segment(r, c_start, seg_len):
-            for c in range(c_start, c_start + seg_len):
-                grid[r][c] = "#"
+            grid[r][c_start:c_start + seg_len] = b"#" * seg_len
             placed_low += 1
 
     # ---- Optional: some mid/high platforms for variety (sparser) ----
@@ -136,64 +149,65 @@ def gen_map(width: int, height: int, ground_y: int, platforms: int, rng: random.
             length = rng.randint(MIN_PLATFORM_LEN, MAX_PLATFORM_LEN)
             c_start = rng.randint(1, width - length - 2)
             if can_place_segment(r, c_start, length):
-                for c in range(c_start, c_start + length):
-                    grid[r][c] = "#"
+                grid[r][c_start:c_start + length] = b"#" * length
                 placed += 1
 
     # ---- Spawn pocket near ground with safe runway ----
     spawn_row = ground_y - 1
     spawn_col = 2
     # clear space around spawn
+    c0, c1 = max(spawn_col - 1, 0), min(spawn_col + 3, width)
     for rr in [spawn_row, spawn_row - 1]:
         if 0 <= rr < height:
-            for cc in range(spawn_col - 1, spawn_col + 3):
-                if 0 <= cc < width:
-                    grid[rr][cc] = "."
+            grid[rr][c0:c1] = b"." * (c1 - c0)
 
-    grid[spawn_row][spawn_col] = "S"
+    grid[spawn_row][spawn_col] = ord("S")
 
     # Safe runway to the right of spawn (momentum build-up)
     lane_width = 12
+    lane_end = max(min(spawn_col + lane_width, width - 1), spawn_col)
     for rr in range(spawn_row - 2, spawn_row + 1):
         if 0 <= rr < height:
-            for cc in range(spawn_col, min(spawn_col + lane_width, width - 1)):
-                grid[rr][cc] = "."
+            grid[rr][spawn_col:lane_end] = b"." * (lane_end - spawn_col)
 
-    return ["".join(row) for row in grid]
+    return [row.decode("ascii") for row in grid]
 
 
 # ====== Command motifs ======
 def emit_run(direction: str, length: int, rng: random.Random) -> list[str]:
-    thrust = RIGHT_THRUST if direction == "right" else LEFT_THRUST
-    op = "RIGHT" if direction == "right" else "LEFT"
+    run = LINE_RIGHT if direction == "right" else LINE_LEFT
     cmds = []
-    since_jump = RUN_JUMP_COOLDOWN
-    for _ in range(length):
-        if since_jump >= RUN_JUMP_COOLDOWN and rng.random() < RUN_JUMP_CHANCE:
-            cmds.append(f"JUMP {JUMP_FORCE:.2f}")
-            since_jump = 0
+    i = 0
+    while i < length:
+        if rng.random() < RUN_JUMP_CHANCE:
+            cmds.append(LINE_JUMP)
+            i += 1
+            # No jump roll during the cooldown: add those run frames as one block
+            n = min(RUN_JUMP_COOLDOWN, length - i)
+            cmds += [run] * n
+            i += n
         else:
-            cmds.append(f"{op} {thrust:.2f}")
-            since_jump += 1
+            cmds.append(run)
+            i += 1
     return cmds
 
 
 def emit_coast(length: int) -> list[str]:
-    return ["WAIT"] * length
+    return [LINE_WAIT] * length
 
 
 def emit_hop() -> list[str]:
-    cmds = ["WAIT"] * HOP_NEUTRAL_BEFORE
-    cmds.append(f"JUMP {JUMP_FORCE:.2f}")
-    cmds += ["WAIT"] * HOP_NEUTRAL_AFTER
+    cmds = [LINE_WAIT] * HOP_NEUTRAL_BEFORE
+    cmds.append(LINE_JUMP)
+    cmds += [LINE_WAIT] * HOP_NEUTRAL_AFTER
     return cmds
 
 
 def emit_burst_turn(rng: random.Random) -> list[str]:
     if rng.random() < 0.5:
-        burst = [f"LEFT {LEFT_THRUST:.2f}"] * rng.randint(5, 12)
+        burst = [LINE_LEFT] * rng.randint(5, 12)
     else:
-        burst = [f"RIGHT {RIGHT_THRUST:.2f}"] * rng.randint(5, 12)
+        burst = [LINE_RIGHT] * rng.randint(5, 12)
     return burst + emit_coast(rng.randint(COAST_MIN, COAST_MAX))
 
 
@@ -201,22 +215,16 @@ def emit_stair_climb_intent(rng: random.Random) -> list[str]:
     cmds = []
     for _ in range(rng.randint(2, 5)):
         run_len = rng.randint(RUN_MIN // 2, RUN_MAX // 2)
-        cmds += [f"RIGHT {RIGHT_THRUST:.2f}"] * run_len
-        cmds += ["WAIT"] * rng.randint(2, 5)
-        cmds.append(f"JUMP {JUMP_FORCE:.2f}")
-        cmds += ["WAIT"] * rng.randint(3, 8)
+        cmds += [LINE_RIGHT] * run_len
+        cmds += [LINE_WAIT] * rng.randint(2, 5)
+        cmds.append(LINE_JUMP)
+        cmds += [LINE_WAIT] * rng.randint(3, 8)
     return cmds
 
 
 def pick_motif(rng: random.Random) -> str:
-    total = sum(MOTIF_WEIGHTS.values())
-    x = rng.random() * total
-    s = 0.0
-    for k, w in MOTIF_WEIGHTS.items():
-        s += w
-        if x <= s:
-            return k
-    return "run_right"
+    # Single rng.random() draw, bisected over the cumulative weights
+    return rng.choices(_MOTIF_NAMES, cum_weights=_MOTIF_CUM, k=1)[0]
 
 
 def build_command_stream(total_frames: int, rng: random.Random, fps: int) -> list[str]:
@@ -240,6 +248,23 @@ def build_command_stream(total_frames: int, rng: random.Random, fps: int) -> lis
     return cmds[:total_frames]
 
 
+def command_bin_path(cmd_path: str) -> str:
+    """commands.txt -> commands.bin (next to it)."""
+    return os.path.splitext(cmd_path)[0] + ".bin"
+
+
+def write_command_bin(path: str, cmds: list[str]) -> None:
+    """
+    Binary twin of commands.txt: N command codes (signed bytes, SonicPlayer codes) followed by
+    N values (native doubles), so a replay can load them without splitting/parsing any text.
+    Values are the floats parsed back from the text lines, hence replays are identical.
+    """
+    encoded = [encode_command(line.split()) for line in cmds]
+    with open(path, "wb") as f:
+        array("b", [cmd for cmd, _ in encoded]).tofile(f)
+        array("d", [val for _, val in encoded]).tofile(f)
+
+
 # ====== CLI / main ======
 def main() -> None:
     parser = argparse.ArgumentParser(description="Generate platformer grid and per-frame commands.")
@@ -266,11 +291,13 @@ def main() -> None:
         f.write("\n".join(grid_lines) + "\n")
 
     with open(args.out_cmd, "w", encoding="utf-8") as f:
-        for line in cmds:
-            f.write(line + "\n")
+        f.write("\n".join(cmds) + "\n")
+
+    out_bin = command_bin_path(args.out_cmd)
+    write_command_bin(out_bin, cmds)
 
-    print(f"Wrote {args.out_map} ({args.width}x{args.height}, ground_y={ground_y}) "
-          f"and {args.out_cmd} ({total_frames} frames @ {fps} FPS).")
+    print(f"Wrote {args.out_map} ({args.width}x{args.height}, ground_y={ground_y}), "
+          f"{args.out_cmd} ({total_frames} frames @ {fps} FPS) and {out_bin}.")
 
 
 if __name__ == "__main__":
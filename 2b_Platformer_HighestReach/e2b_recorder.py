@@ -2,7 +2,7 @@ import argparse
 import pygame
 import sys
 from pathlib import Path
-from SonicRecorder import SonicGame
+from SonicRecorder import SonicGame, tile_runs
 
 
 
@@ -16,14 +16,13 @@ def draw_map(surface, lines: list[str], tile: int) -> tuple[int, int]:
     Retourne (width_px, height_px)."""
     h = len(lines)
     w = max((len(row) for row in lines), default=0)
+    # Une plage horizontale de tuiles identiques est remplie d'un seul coup ; '.' => rien
     for r, row in enumerate(lines):
-        for c, ch in enumerate(row):
-            x, y = c * tile, r * tile
-            if ch == "#":
-                pygame.draw.rect(surface, (60, 60, 60), (x, y, tile, tile))
-            elif ch == "S":
-                pygame.draw.rect(surface, (30, 144, 255), (x, y, tile, tile))  # bleu
-            # '.' => rien
+        y = r * tile
+        for c, n in tile_runs(row, "#"):
+            surface.fill((60, 60, 60), (c * tile, y, n * tile, tile))
+        for c, n in tile_runs(row, "S"):
+            surface.fill((30, 144, 255), (c * tile, y, n * tile, tile))  # bleu
     return w * tile, h * tile
 
 
@@ -85,14 +84,14 @@ def main():
     game = SonicGame(map_lines, 16)
 
     commands: list[str] = []
+    last_cmd = "None"  # shown in the HUD, kept in sync with commands[-1]
     paused = False
     prev_space = False
     just_saved = False
 
     while True:
         # Gestion événements (pour pause, undo, save, quit)
-        # Rendu de fond (carte si présente)
-        screen.fill((10, 10, 12))
+        # Le fond et la carte sont rendus par game.draw() (couche statique pré-rendue)
         cmd_frame = "WAIT"
 
         for event in pygame.event.get():
@@ -112,11 +111,13 @@ def main():
                     just_saved = True
                 elif event.key == pygame.K_BACKSPACE and commands:
                     commands.pop()
+                    last_cmd = commands[-1] if commands else "None"
 
         if not paused:
             keys = pygame.key.get_pressed()
             cmd_frame, prev_space = build_frame_command(keys, prev_space, args.thrust, args.jump)
             commands.append(cmd_frame)
+            last_cmd = cmd_frame
 
         game.manage(cmd_frame)
         game.draw(screen)
@@ -124,7 +125,7 @@ def main():
         # Overlay d'info
         hud = [
             f"Frames recorded: {len(commands)}  (target FPS: {args.fps})",
-            f"Last cmd: {commands[-1] if commands else 'None'}",
+            f"Last cmd: {last_cmd}",
             "Keys: ←/→ thrust | SPACE jump | P pause | BACKSPACE undo | S save | ESC quit",
             f"Output: {args.out}",
         ]
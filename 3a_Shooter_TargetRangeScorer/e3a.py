@@ -1,57 +1,103 @@
 import math
 import pygame
-from typing import List
-
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+
+SCORE_LABELS = {10: "Bullseye", 5: "Inner", 3: "Outer"}
+
+
+def target_columns(targets: Sequence[Sequence[float]]) -> Tuple[List[float], ...]:
+    # Struct of arrays: one list per field (x, y, r1², r2², r3²), squared once before scoring
+    # so the hot loop compares squared distances without any sqrt
+    tx = [t[0] for t in targets]
+    ty = [t[1] for t in targets]
+    bullseye_sq = [t[2] * t[2] for t in targets]
+    inner_sq = [t[3] * t[3] for t in targets]
+    outer_sq = [t[4] * t[4] for t in targets]
+    return tx, ty, bullseye_sq, inner_sq, outer_sq
+
+
+def build_target_grid(targets: Sequence[Sequence[float]], cell: float) -> Dict[Tuple[int, int], List[int]]:
+    # Spatial hash: target indices binned by the cell holding their center
+    grid = defaultdict(list)
+    for idx, target in enumerate(targets):
+        grid[(math.floor(target[0] / cell), math.floor(target[1] / cell))].append(idx)
+    return grid
+
+
+def nearby_targets(grid: Dict[Tuple[int, int], List[int]], cell: float, shot: Sequence[float]) -> List[int]:
+    # With cell = 2 * biggest outer radius, any target able to score lies within half a cell of
+    # the shot, so only the shot's cell and its closest neighbour on each axis can hold it
+    fx, fy = shot[0] / cell, shot[1] / cell
+    cx, cy = math.floor(fx), math.floor(fy)
+    nx = cx - 1 if fx - cx < 0.5 else cx + 1
+    ny = cy - 1 if fy - cy < 0.5 else cy + 1
+
+    found = []
+    for key in ((cx, cy), (nx, cy), (cx, ny), (nx, ny)):
+        found += grid.get(key, ())
+    found.sort()  # keep the file order of the targets
+    return found
+
+
+def score_all(targets: Sequence[Sequence[float]], shots: Sequence[Sequence[float]]) -> Tuple[List[int], Dict[int, str]]:
+    # Scores every shot against every target in one batch and returns the score histogram
+    # (index = points) with the label of the last hit of each shot.
+    # Only targets close to a shot can score, look them up through a spatial hash
+    cell = 2 * max((t[4] for t in targets), default=0.0)
+    if cell <= 0:
+        cell = 1.0
+    grid = build_target_grid(targets, cell)
+    tx, ty, bullseye_sq, inner_sq, outer_sq = target_columns(targets)
+
+    hits = [0] * 11
+    log_shots = {}
+    for i, shot in enumerate(shots):
+        shot_x, shot_y = shot
+        for idx in nearby_targets(grid, cell, shot):
+            dx = tx[idx] - shot_x
+            dy = ty[idx] - shot_y
+            distance_sq = dx * dx + dy * dy
+
+            if distance_sq <= bullseye_sq[idx]:
+                score = 10
+            elif distance_sq <= inner_sq[idx]:
+                score = 5
+            elif distance_sq <= outer_sq[idx]:
+                score = 3
+            else:
+                continue
 
-def get_shoot_score(target: List[str], shot: list[str]) -> int:
-    pos_x = int(target[0])
-    pos_y = int(target[1])
+            hits[score] += 1
+            log_shots[i] = SCORE_LABELS[score]
 
-    radius_bullseye = float(target[2])
-    radius_inner = float(target[3])
-    radius_outer = float(target[4])
+    return hits, log_shots
 
-    #Calculate hypothenuse
-    distance = math.hypot(pos_x - float(shot[0]), pos_y - float(shot[1]))
 
-    if distance <= radius_bullseye:
-        return 10
-    elif distance <= radius_inner:
-        return 5
-    elif distance <= radius_outer:
-        return 3
+def read_rows(path: str, ncols: int, sep: str = None) -> List[Tuple[float, ...]]:
+    # Whole file parsed in one pass: a single read, a single split and one float() per number,
+    # then regrouped into rows of ncols values. Kept as bytes (float() accepts them): no decoding
+    data = Path(path).read_bytes()
+    if sep is not None:
+        data = data.replace(sep.encode(), b" ")
 
-    return 0
+    values = list(map(float, data.split()))
+    if len(values) % ncols:
+        raise ValueError(f"{path}: expected {ncols} numbers per line")
+    return list(zip(*[iter(values)] * ncols))
 
 
 def main():
-    with open("data/rings.txt") as fr:
-        targets = fr.readlines()
-        targets = [t.strip().split() for t in targets]
+    # Parse every number once up front, the scoring loop then only does arithmetic
+    targets = read_rows("data/rings.txt", 5)
+    shots = read_rows("data/shots.txt", 2, sep=",")
 
-    with open("data/shots.txt") as fs:
-        shots = fs.readlines()
-        shots = [s.strip().split(",") for s in shots]
-
-    total_score = 0
-    log_shots = {}
-    log_nb = {"Bullseye": 0, "Inner": 0, "Outer": 0}
-    for i, shot in enumerate(shots):
-        for target in targets:
-            score = get_shoot_score(target, shot)
-
-            match score:
-                case 10:
-                    log_shots[i] = "Bullseye"
-                    log_nb["Bullseye"] += 1
-                case 5:
-                    log_shots[i] = "Inner"
-                    log_nb["Inner"] += 1
-                case 3:
-                    log_shots[i] = "Outer"
-                    log_nb["Outer"] += 1
-
-            total_score += score
+    hits, log_shots = score_all(targets, shots)
+    total_score = sum(points * count for points, count in enumerate(hits))
+    log_nb = {label: hits[points] for points, label in SCORE_LABELS.items()}
 
     #print(f"Logs of all the shots individually: {log_shots}")
     #print(f"Logs By Count: {log_nb}")
@@ -78,6 +124,7 @@ SHOT_BULL = (255, 80, 80)    # 10 pts
 SHOT_INNER = (80, 160, 255)  # 5 pts
 SHOT_OUTER = (80, 200, 120)  # 3 pts
 SHOT_MISS = (120, 120, 120)  # 0 pts
+SHOT_COLORS = {10: SHOT_BULL, 5: SHOT_INNER, 3: SHOT_OUTER}
 
 HUD_COLOR = (230, 230, 230)
 
@@ -96,10 +143,8 @@ def score_shot(cx, cy, r1, r2, r3, x, y) -> int:
 
 # ---------- Parsing ----------
 def load_targets_and_shots(rings_path, shots_path):
-    with open(rings_path, "r", encoding="utf-8") as fr:
-        rings = [tuple(map(float, ln.split())) for ln in fr if ln.strip()]
-    with open(shots_path, "r", encoding="utf-8") as fs:
-        shots = [tuple(map(float, ln.split(","))) for ln in fs if ln.strip()]
+    rings = read_rows(rings_path, 5)
+    shots = read_rows(shots_path, 2, sep=",")
 
     n = min(len(rings), len(shots))
     if n < len(rings) or n < len(shots):
@@ -112,22 +157,25 @@ def load_targets_and_shots(rings_path, shots_path):
     return pairs
 
 # ---------- World ↔ Screen mapping ----------
+# The config is constant: mapping factors computed once at import time
+WORLD_SPAN = WORLD_MAX - WORLD_MIN
+USABLE_W = SCREEN_W - 2 * PADDING
+USABLE_H = SCREEN_H - 2 * PADDING
+PPU = USABLE_W / WORLD_SPAN  # square mapping
+
 def pixels_per_unit() -> float:
-    usable_w = SCREEN_W - 2 * PADDING
-    world_span = (WORLD_MAX - WORLD_MIN)
-    return usable_w / world_span  # square mapping
+    return PPU
 
 def world_to_screen(x: float, y: float):
     # Normalize to [0..1], then scale to screen; invert Y for screen coords
-    s = pixels_per_unit()
-    nx = (x - WORLD_MIN) / (WORLD_MAX - WORLD_MIN)
-    ny = (y - WORLD_MIN) / (WORLD_MAX - WORLD_MIN)
-    sx = int(PADDING + nx * (SCREEN_W - 2 * PADDING))
-    sy = int(PADDING + (1 - ny) * (SCREEN_H - 2 * PADDING))
+    nx = (x - WORLD_MIN) / WORLD_SPAN
+    ny = (y - WORLD_MIN) / WORLD_SPAN
+    sx = int(PADDING + nx * USABLE_W)
+    sy = int(PADDING + (1 - ny) * USABLE_H)
     return sx, sy
 
 def world_radius_to_pixels(r: float) -> int:
-    return int(r * pixels_per_unit())
+    return int(r * PPU)
 
 # ---------- Drawing ----------
 def draw_target(surface, cx, cy, R1, R2, R3):
@@ -140,14 +188,12 @@ def draw_target(surface, cx, cy, R1, R2, R3):
 
 def draw_shot(surface, x, y, shot_score):
     sx, sy = world_to_screen(x, y)
-    color = SHOT_MISS
-    if shot_score == 10:
-        color = SHOT_BULL
-    elif shot_score == 5:
-        color = SHOT_INNER
-    elif shot_score == 3:
-        color = SHOT_OUTER
-    pygame.draw.circle(surface, color, (sx, sy), 5)
+    pygame.draw.circle(surface, SHOT_COLORS.get(shot_score, SHOT_MISS), (sx, sy), 5)
+
+@lru_cache(maxsize=256)
+def render_hud_line(font, text):
+    # The HUD lines only change when a shot is revealed: rasterize each distinct line once
+    return font.render(text, True, HUD_COLOR)
 
 def draw_hud(surface, font, idx, total, counts, total_pairs):
     lines = [
@@ -161,7 +207,7 @@ def draw_hud(surface, font, idx, total, counts, total_pairs):
     ]
     x, y = 12, 10
     for line in lines:
-        surf = font.render(line, True, HUD_COLOR)
+        surf = render_hud_line(font, line)
         surface.blit(surf, (x, y))
         y += surf.get_height() + 4
 
@@ -188,6 +234,9 @@ def main_extended():
     total_score = 0
     counts = {"Bullseye": 0, "Inner": 0, "Outer": 0, "Miss": 0}
 
+    # The scene only changes when a pair is revealed: redraw on those frames (or when the window
+    # needs repainting) instead of 60 full repaints per second
+    needs_redraw = True
 
     running = True
     while running:
@@ -200,23 +249,23 @@ def main_extended():
             elif event.type == pygame.KEYDOWN:
                 if event.key in (pygame.K_ESCAPE, pygame.K_q):
                     running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                needs_redraw = True
 
         # Step to next pair every STEP_DELAY_MS
         if shown_pairs < total_pairs and (now - last_step_time >= STEP_DELAY_MS):
             (cx, cy, R1, R2, R3), (x, y) = pairs[shown_pairs]
             s = score_shot(cx, cy, R1, R2, R3, x, y)
             total_score += s
-            if s == 10:
-                counts["Bullseye"] += 1
-            elif s == 5:
-                counts["Inner"] += 1
-            elif s == 3:
-                counts["Outer"] += 1
-            else:
-                counts["Miss"] += 1
+            counts[SCORE_LABELS.get(s, "Miss")] += 1
 
             shown_pairs += 1
             last_step_time = now
+            needs_redraw = True
+
+        if not needs_redraw:
+            continue
+        needs_redraw = False
 
         # ----- Render -----
         screen.fill(BG_COLOR)
@@ -1,5 +1,6 @@
 import random
 import math
+from collections import defaultdict
 from typing import List, Tuple
 
 WORLD_MIN = -1000
@@ -15,12 +16,28 @@ MIN_GAP = 5.0          # extra clearance between outer rings (in world units)
 CENTER_ATTEMPTS = 2000 # attempts per radii set to find a non-overlapping center
 RADII_REGEN_MAX = 25   # times we allow re-rolling radii if placement fails
 
+# Shot kinds drawn for each target (3 of the 6 are misses)
+SHOT_CASES = ("bullseye", "inner", "outer", "miss1", "miss2", "miss3")
+
 def gen_radii() -> Tuple[float, float, float]:
     R1 = round(random.uniform(R1_MIN, R1_MAX), 1)
     R2 = round(R1 + random.uniform(R2_ADD_MIN, R2_ADD_MAX), 1)
     R3 = round(R2 + random.uniform(R3_ADD_MIN, R3_ADD_MAX), 1)
     return R1, R2, R3
 
+def collides(cx: int, cy: int, R3: float, bins, cell: float, min_gap: float) -> bool:
+    """True if the circle (cx, cy, R3) gets closer than min_gap to a binned target's outer circle."""
+    bx, by = int(cx // cell), int(cy // cell)
+    for nbx in (bx - 1, bx, bx + 1):
+        for nby in (by - 1, by, by + 1):
+            for (pcx, pcy, pR3) in bins.get((nbx, nby), ()):
+                dx = cx - pcx
+                dy = cy - pcy
+                thr = R3 + pR3 + min_gap
+                if dx * dx + dy * dy < thr * thr:  # squared: no sqrt needed for the threshold test
+                    return True
+    return False
+
 def non_overlapping_center(
     R3: float, placed: List[Tuple[int, int, float]], min_gap: float
 ) -> Tuple[int, int]:
@@ -29,17 +46,19 @@ def non_overlapping_center(
     doesn't overlap any existing target's outer circle, considering min_gap.
     Returns (cx, cy) or raises ValueError if not found after many attempts.
     """
+    # Bin the placed targets once per call: with cells as wide as the largest possible clearance,
+    # a candidate can only collide with targets of its own cell or of the 8 around it
+    cell = R3 + max((pR3 for _, _, pR3 in placed), default=0.0) + min_gap
+    if cell <= 0:
+        cell = 1.0
+    bins = defaultdict(list)
+    for target in placed:
+        bins[(int(target[0] // cell), int(target[1] // cell))].append(target)
+
     for _ in range(CENTER_ATTEMPTS):
         cx = random.randint(WORLD_MIN, WORLD_MAX)
         cy = random.randint(WORLD_MIN, WORLD_MAX)
-        ok = True
-        for (pcx, pcy, pR3) in placed:
-            dx = cx - pcx
-            dy = cy - pcy
-            if math.hypot(dx, dy) < (R3 + pR3 + min_gap):
-                ok = False
-                break
-        if ok:
+        if not collides(cx, cy, R3, bins, cell, min_gap):
             return cx, cy
     raise ValueError("No non-overlapping center found for these radii.")
 
@@ -89,31 +108,35 @@ def generate_data(num_shots: int = 20, seed: int = None, min_gap: float = MIN_GA
         targets.append((cx, cy, R1, R2, R3))
 
     # 2) Generate one shot around each placed target (bullseye/inner/outer/miss)
-    with open("data/rings.txt", "w", encoding="utf-8") as fr, \
-         open("data/shots.txt", "w", encoding="utf-8") as fs:
-
-        for (cx, cy, R1, R2, R3) in targets:
-            fr.write(f"{cx} {cy} {R1} {R2} {R3}\n")
-
-            case = random.choice(["bullseye", "inner", "outer", "miss1", "miss2", "miss3"])
-            if case == "bullseye":
-                d = random.uniform(0, R1 * 0.9)
-            elif case == "inner":
-                d = random.uniform(R1 + 1, R2 * 0.9)
-            elif case == "outer":
-                d = random.uniform(R2 + 1, R3 * 0.9)
-            else:  # miss
-                d = random.uniform(R3 + 10, R3 + 300)
-                nb_missed += 1
-
-            angle = random.uniform(0, 2 * math.pi)
-            x = round(cx + d * math.cos(angle), 2)
-            y = round(cy + d * math.sin(angle), 2)
-
-            # keep shots inside world bounds for neatness
-            x = max(WORLD_MIN, min(WORLD_MAX, x))
-            y = max(WORLD_MIN, min(WORLD_MAX, y))
-            fs.write(f"{x},{y}\n")
+    #    Lines are collected then each file is written with a single call
+    ring_lines = [f"{cx} {cy} {R1} {R2} {R3}\n" for (cx, cy, R1, R2, R3) in targets]
+    shot_lines = []
+    uniform, cos, sin = random.uniform, math.cos, math.sin
+    for (cx, cy, R1, R2, R3) in targets:
+        case = random.choice(SHOT_CASES)
+        if case == "bullseye":
+            d = uniform(0, R1 * 0.9)
+        elif case == "inner":
+            d = uniform(R1 + 1, R2 * 0.9)
+        elif case == "outer":
+            d = uniform(R2 + 1, R3 * 0.9)
+        else:  # miss
+            d = uniform(R3 + 10, R3 + 300)
+            nb_missed += 1
+
+        angle = uniform(0, 2 * math.pi)
+        x = round(cx + d * cos(angle), 2)
+        y = round(cy + d * sin(angle), 2)
+
+        # keep shots inside world bounds for neatness
+        x = max(WORLD_MIN, min(WORLD_MAX, x))
+        y = max(WORLD_MIN, min(WORLD_MAX, y))
+        shot_lines.append(f"{x},{y}\n")
+
+    with open("data/rings.txt", "w", encoding="utf-8") as fr:
+        fr.write("".join(ring_lines))
+    with open("data/shots.txt", "w", encoding="utf-8") as fs:
+        fs.write("".join(shot_lines))
 
     print(f"✅ Generated {num_shots} non-overlapping targets and paired shots.")
     print("   - rings.txt → cx cy R1 R2 R3")
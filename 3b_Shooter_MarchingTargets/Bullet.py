@@ -5,6 +5,8 @@ from Config import Config
 
 class Bullet:
     """Raygun-style: a point in world space placed when fired."""
+    __slots__ = ("x", "y", "alive")
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
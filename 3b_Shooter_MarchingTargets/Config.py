@@ -15,6 +15,7 @@ class Config:
     TARGET_COLOR = (255, 220, 120)
     TARGET_COLOR_DEAD = (128, 110, 60)
     TARGET_RADIUS = 40
+    TARGET_RADIUS_SQ = TARGET_RADIUS * TARGET_RADIUS  # hit tests compare squared distances
 
     BULLET_COLOR = (255, 90, 90)
     BULLET_RADIUS_PX = 5
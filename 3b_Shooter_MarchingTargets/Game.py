@@ -1,4 +1,5 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 import pygame
 
 from UtilityFunctions import UtilityFunctions
@@ -8,15 +9,26 @@ from Target import Target
 from InstructionStream import InstructionStream
 
 
+# Simulated frame length (ms): the fixed step update() is given, and in headless mode the clock step too
+_FRAME_MS = 16.67
+
+
+@lru_cache(maxsize=256)
+def _render_hud_line(font: pygame.font.Font, text: str) -> pygame.Surface:
+    """Rasterizes one HUD line; lines unchanged from one frame to the next are reused."""
+    return font.render(text, True, Config.HUD_COLOR)
+
+
 class Game:
-    def __init__(self, targets: List[Target], instr: List[str]):
-        pygame.init()
-        pygame.display.set_caption("Medium3 – Moving Targets, Raygun Shots (OOP)")
-        self.screen = pygame.display.set_mode((Config.SCREEN_W, Config.SCREEN_H))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 22)
+    def __init__(self, targets: List[Target], instr: List[Tuple[float, float]], headless: bool = False):
+        # headless: simulation only (see run_headless), no window, fonts or sprites are created
+        self.headless = headless
 
         self.targets = targets
+        # only the alive targets move or can be hit: update() and the hit test walk this list,
+        # a killed target leaves it and gets its dead color on the next frame (as Target.update does)
+        self._active: List[Target] = [t for t in targets if t.alive]
+        self._just_killed: List[Target] = [t for t in targets if not t.alive]
         self.instructions = InstructionStream(instr)
         self.running = True
 
@@ -24,15 +36,39 @@ class Game:
         self.last_step_time = 0
         self.sim_time_ms = 0
 
-        # bullets fired
-        self.bullets: List[Bullet] = []
-
         # score
         self.score = 0
         self.hits = 0
         self.shots_fired = 0
         self.step_count = 0
 
+        if not headless:
+            self._init_display()
+
+    def _init_display(self):
+        pygame.init()
+        pygame.display.set_caption("Medium3 – Moving Targets, Raygun Shots (OOP)")
+        self.screen = pygame.display.set_mode((Config.SCREEN_W, Config.SCREEN_H))
+        self.clock = pygame.time.Clock()
+        self.font = pygame.font.SysFont(None, 22)
+
+        # bullets fired: the shots never move, so each one is stamped once on a transparent
+        # layer and that layer keeps every shot on screen
+        self._bullet_layer = pygame.Surface((Config.SCREEN_W, Config.SCREEN_H), pygame.SRCALPHA)
+
+        # sprites drawn once, each frame blits them all in a single screen.blits() call
+        self._target_radius_px = UtilityFunctions.world_radius_to_pixels(Config.TARGET_RADIUS)
+        self._target_sprites = {
+            color: UtilityFunctions.circle_sprite(color, self._target_radius_px)
+            for color in (Config.TARGET_COLOR, Config.TARGET_COLOR_DEAD)
+        }
+        self._bullet_sprite = UtilityFunctions.circle_sprite(Config.BULLET_COLOR, Config.BULLET_RADIUS_PX)
+
+        # static backdrop (background + world frame) painted once, each frame starts from a copy of it
+        self._backdrop = pygame.Surface((Config.SCREEN_W, Config.SCREEN_H)).convert()
+        self._backdrop.fill(Config.BG_COLOR)
+        self._draw_frame(self._backdrop)
+
     # ----- core loop -----
     def run(self):
         while self.running:
@@ -40,12 +76,25 @@ class Game:
             self.sim_time_ms += dt_ms
 
             self.handle_events()
-            self.update(16.67 / 1000.0)  # seconds
+            self.update(_FRAME_MS / 1000.0)  # seconds
             self.draw()
 
         print(f"Final Score for the game after {self.shots_fired} shots : {self.score}pts")
         pygame.quit()
 
+    def run_headless(self) -> int:
+        """
+        Same simulation as run() on a fixed 60 FPS clock, without events, rendering or waiting:
+        resolves every shot as fast as possible and returns the final score.
+        (run() advances time with the real frame durations, so its score can differ slightly.)
+        """
+        while not self.instructions.exhausted():
+            self.sim_time_ms += _FRAME_MS
+            self.update(_FRAME_MS / 1000.0)  # seconds
+
+        print(f"Final Score for the game after {self.shots_fired} shots : {self.score}pts")
+        return self.score
+
     def handle_events(self):
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
@@ -56,9 +105,13 @@ class Game:
 
     # ----- update world -----
     def update(self, dt_sec: float):
-        # 1) Continuous motion for all targets
-        for t in self.targets:
+        # 1) Continuous motion for all alive targets, last frame's kills turn to their dead color
+        for t in self._active:
             t.update(dt_sec)
+        if self._just_killed:
+            for t in self._just_killed:
+                t.update(dt_sec)
+            self._just_killed = []
 
         # 2) One instruction per second
         now = self.sim_time_ms
@@ -68,17 +121,15 @@ class Game:
             self.step_count += 1
 
     def process_next_instruction(self):
-        line = self.instructions.next()
-        if not line:
+        shot = self.instructions.next()
+        if shot is None:
             return
 
-        parts = line.split(",")
-
-        sx = float(parts[0])
-        sy = float(parts[1])
+        sx, sy = shot
 
         bullet = Bullet(sx, sy)
-        self.bullets.append(bullet)
+        if not self.headless:
+            self._stamp_bullet(bullet)
         self.shots_fired += 1
 
         # Raygun: resolve hit AT THE MOMENT of the shot (or across lifetime if configured)
@@ -88,46 +139,63 @@ class Game:
 
     def resolve_hits_at_point(self, sx: float, sy: float):
         # any target within TARGET_RADIUS (world units) is removed and scored
-        hits_this_shot = 0
-        for t in self.targets:
-            if not t.alive:
+        killed = []
+        radius = Config.TARGET_RADIUS
+        for t in self._active:
+            # broadphase: a target outside the square around the shot can't be within the radius
+            if abs(t.x - sx) > radius or abs(t.y - sy) > radius:
                 continue
 
-            if t.distance_to(sx, sy) <= Config.TARGET_RADIUS:
+            if t.hit_by(sx, sy):
                 t.alive = False
-                hits_this_shot += 1
+                killed.append(t)
 
-        if hits_this_shot:
+        if killed:
+            hits_this_shot = len(killed)
+            self._active = [t for t in self._active if t.alive]
+            self._just_killed += killed
             self.hits += hits_this_shot
             self.score += hits_this_shot * Config.SCORE_PER_HIT
 
     # ----- rendering -----
-    def draw(self):
-        self.screen.fill(Config.BG_COLOR)
+    def _stamp_bullet(self, bullet: Bullet):
+        r = Config.BULLET_RADIUS_PX
+        sx, sy = UtilityFunctions.world_to_screen(bullet.x, bullet.y)
+        self._bullet_layer.blit(self._bullet_sprite, (sx - r, sy - r))
 
-        # draw an outer "board" like Easy3 (just the world frame)
-        self._draw_frame()
+    def draw(self):
+        # background and outer "board" like Easy3 (just the world frame), prerendered
+        self.screen.blit(self._backdrop, (0, 0))
+
+        to_screen = UtilityFunctions.world_to_screen_many
+
+        # draw targets (screen coordinates of all of them in one call)
+        targets = self.targets
+        r = self._target_radius_px
+        sprites = self._target_sprites
+        blits = [
+            (sprites[t.color], (sx - r, sy - r))
+            for t, (sx, sy) in zip(targets, to_screen([t.x for t in targets], [t.y for t in targets]))
+        ]
 
-        # draw targets
-        for t in self.targets:
-            t.draw(self.screen)
+        # draw bullets (persistent): every shot fired so far, already on its layer
+        blits.append((self._bullet_layer, (0, 0)))
 
-        # draw bullets (if persistent)
-        for b in self.bullets:
-            b.draw(self.screen)
+        self.screen.blits(blits, doreturn=False)
 
         # HUD
         self._draw_hud()
 
         pygame.display.flip()
 
-    def _draw_frame(self):
+    @staticmethod
+    def _draw_frame(surf: pygame.Surface):
         # three cosmetic rings around the world center (optional, like Easy3 vibe)
         cx, cy = UtilityFunctions.world_to_screen(0.0, 0.0)
-        pygame.draw.circle(self.screen, Config.RING_OUTER, (cx, cy), UtilityFunctions.world_radius_to_pixels(900), width=2)
-        pygame.draw.circle(self.screen, Config.RING_INNER, (cx, cy), UtilityFunctions.world_radius_to_pixels(600), width=2)
-        pygame.draw.circle(self.screen, Config.RING_BULL, (cx, cy), UtilityFunctions.world_radius_to_pixels(300), width=2)
-        pygame.draw.circle(self.screen, Config.CENTER_DOT, (cx, cy), 3)
+        pygame.draw.circle(surf, Config.RING_OUTER, (cx, cy), UtilityFunctions.world_radius_to_pixels(900), width=2)
+        pygame.draw.circle(surf, Config.RING_INNER, (cx, cy), UtilityFunctions.world_radius_to_pixels(600), width=2)
+        pygame.draw.circle(surf, Config.RING_BULL, (cx, cy), UtilityFunctions.world_radius_to_pixels(300), width=2)
+        pygame.draw.circle(surf, Config.CENTER_DOT, (cx, cy), 3)
 
     def _draw_hud(self):
         lines = [
@@ -141,6 +209,6 @@ class Game:
 
         x, y = 12, 10
         for line in lines:
-            surf = self.font.render(line, True, Config.HUD_COLOR)
+            surf = _render_hud_line(self.font, line)
             self.screen.blit(surf, (x, y))
             y += surf.get_height() + 4
@@ -1,16 +1,19 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class InstructionStream:
-    """Feeds one instruction per second to the game."""
-    def __init__(self, lines: List[str]):
-        self.lines = lines
+    """Feeds one instruction (a shot's world x, y) per second to the game."""
+    def __init__(self, shots: List[Tuple[float, float]]):
+        self.shots = shots
         self.idx = 0
 
-    def next(self) -> Optional[str]:
-        if self.idx >= len(self.lines):
+    def next(self) -> Optional[Tuple[float, float]]:
+        if self.idx >= len(self.shots):
             return None
 
-        s = self.lines[self.idx].strip()
+        shot = self.shots[self.idx]
         self.idx += 1
-        return s
+        return shot
+
+    def exhausted(self) -> bool:
+        return self.idx >= len(self.shots)
@@ -1,10 +1,16 @@
 import pygame
-import math
 from UtilityFunctions import UtilityFunctions
 from Config import Config
 
+# World bounds read once, the bounce test runs for every target on every frame
+_WORLD_MIN = Config.WORLD_MIN
+_WORLD_MAX = Config.WORLD_MAX
+
 
 class Target:
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access in the per-frame loops
+    __slots__ = ("id", "x", "y", "vx", "vy", "alive", "color")
+
     def __init__(self, tid: int, x: float, y: float, vx: float, vy: float):
         self.id = tid
         self.x = x
@@ -19,20 +25,17 @@ class Target:
             self.color = Config.TARGET_COLOR_DEAD
             return
 
-        self.x += self.vx * dt_sec
-        self.y += self.vy * dt_sec
-
-        if self.x <= Config.WORLD_MIN:
-            self.vx*= -1
-
-        if self.y <= Config.WORLD_MIN:
-            self.vy*= -1
+        x = self.x + self.vx * dt_sec
+        y = self.y + self.vy * dt_sec
+        self.x = x
+        self.y = y
 
-        if self.x >= Config.WORLD_MAX:
-            self.vx*= -1
+        # One bounce test per axis (a position can't be past both bounds at once)
+        if x <= _WORLD_MIN or x >= _WORLD_MAX:
+            self.vx = -self.vx
 
-        if self.y >= Config.WORLD_MAX:
-            self.vy*= -1
+        if y <= _WORLD_MIN or y >= _WORLD_MAX:
+            self.vy = -self.vy
 
     def draw(self, surf: pygame.Surface) -> None:
         # Convert world radius to pixel radius dynamically
@@ -41,7 +44,8 @@ class Target:
         sx, sy = UtilityFunctions.world_to_screen(self.x, self.y)
         pygame.draw.circle(surf, self.color, (sx, sy), pixel_radius)
 
-    def distance_to(self, wx: float, wy: float) -> float:
+    def hit_by(self, wx: float, wy: float) -> bool:
+        """True if a shot at (wx, wy) lands within TARGET_RADIUS of this target."""
         dx = self.x - wx
         dy = self.y - wy
-        return math.hypot(dx, dy)
+        return dx * dx + dy * dy <= Config.TARGET_RADIUS_SQ
@@ -1,22 +1,43 @@
-from typing import Tuple
+from typing import Iterable, List, Tuple
+import pygame
 from Config import Config
 
+# Config is constant: the mapping factors are computed once at import time
+_WORLD_SPAN = Config.WORLD_MAX - Config.WORLD_MIN
+_USABLE_W = Config.SCREEN_W - 2 * Config.PADDING
+_USABLE_H = Config.SCREEN_H - 2 * Config.PADDING
+_PPU = _USABLE_W / _WORLD_SPAN  # keep square
+
 
 class UtilityFunctions:
     @staticmethod
     def pixels_per_unit() -> float:
-        usable_w = Config.SCREEN_W - 2 * Config.PADDING
-        world_span = (Config.WORLD_MAX - Config.WORLD_MIN)
-        return usable_w / world_span  # keep square
+        return _PPU
 
     @staticmethod
     def world_to_screen(x: float, y: float) -> Tuple[int, int]:
-        nx = (x - Config.WORLD_MIN) / (Config.WORLD_MAX - Config.WORLD_MIN)
-        ny = (y - Config.WORLD_MIN) / (Config.WORLD_MAX - Config.WORLD_MIN)
-        sx = int(Config.PADDING + nx * (Config.SCREEN_W - 2 * Config.PADDING))
-        sy = int(Config.PADDING + (1 - ny) * (Config.SCREEN_H - 2 * Config.PADDING))
+        nx = (x - Config.WORLD_MIN) / _WORLD_SPAN
+        ny = (y - Config.WORLD_MIN) / _WORLD_SPAN
+        sx = int(Config.PADDING + nx * _USABLE_W)
+        sy = int(Config.PADDING + (1 - ny) * _USABLE_H)
         return sx, sy
 
+    @staticmethod
+    def world_to_screen_many(xs: Iterable[float], ys: Iterable[float]) -> List[Tuple[int, int]]:
+        """world_to_screen() for whole coordinate columns: same arithmetic, constants bound once."""
+        wmin, span, pad, usable_w, usable_h = Config.WORLD_MIN, _WORLD_SPAN, Config.PADDING, _USABLE_W, _USABLE_H
+        return [
+            (int(pad + ((x - wmin) / span) * usable_w), int(pad + (1 - (y - wmin) / span) * usable_h))
+            for x, y in zip(xs, ys)
+        ]
+
     @staticmethod
     def world_radius_to_pixels(r: float) -> int:
-        return int(max(1, int(r * UtilityFunctions.pixels_per_unit())))
\ No newline at end of file
+        return int(max(1, int(r * _PPU)))
+
+    @staticmethod
+    def circle_sprite(color, radius_px: int) -> pygame.Surface:
+        """Filled circle drawn once on a transparent surface, blit it at (sx - radius_px, sy - radius_px)."""
+        sprite = pygame.Surface((2 * radius_px + 1, 2 * radius_px + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius_px, radius_px), radius_px)
+        return sprite
\ No newline at end of file
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List
+import argparse
+from pathlib import Path
+from typing import List, Tuple
 
 from Game import Game
 from Target import Target
@@ -7,31 +9,37 @@ from Target import Target
 
 # ---------------- Data loading ----------------
 def load_targets(path) -> List["Target"]:
-    targets = []
+    # x y vx vy are the first 4 columns: whole file read once as bytes (float() accepts them),
+    # then a single split + map(float) per line
+    lines = Path(path).read_bytes().splitlines()
+    return [Target(i, *map(float, line.split()[:4])) for i, line in enumerate(lines)]
 
-    with open(path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            line = line.strip()
-            parts = line.split()
 
-            x, y, vx, vy = map(float, parts[0:4])
-            targets.append(Target(i, x, y, vx, vy))
-
-    return targets
-
-
-def load_shots(path) -> List[str]:
-    with open(path, "r", encoding="utf-8") as f:
-        return [ln.strip() for ln in f if ln.strip()]
+def load_shots(path) -> List[Tuple[float, float]]:
+    # "x,y" per line parsed once at load time, the game then only unpacks (x, y) pairs
+    shots = []
+    for line in Path(path).read_bytes().splitlines():
+        if line.strip():
+            parts = line.split(b",")
+            shots.append((float(parts[0]), float(parts[1])))
+    return shots
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Moving targets shooter replay.")
+    parser.add_argument("--headless", action="store_true",
+                        help="Simulate on a fixed 60 FPS clock without rendering, print the final score")
+    args = parser.parse_args()
+
     # Load inputs
     targets = load_targets("data/rings.txt")
     instr = load_shots("data/shots.txt")
 
-    game = Game(targets, instr)
-    game.run()
+    game = Game(targets, instr, headless=args.headless)
+    if args.headless:
+        game.run_headless()
+    else:
+        game.run()
 
 
 if __name__ == "__main__":
@@ -16,6 +16,7 @@ import argparse
 import os
 import zlib
 import random
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -23,6 +24,7 @@ from typing import List
 DEFAULT_ROWS = 100
 DEFAULT_WIDTH = 10
 DEFAULT_OBS_RATE = 0.25  # ~25% obstacles
+DEFAULT_ZLIB_LEVEL = 6   # ~10x faster than 9 on these grids, for ~5% bigger files
 FINISH_ROWS = 5          # keep 0 for now (pure 100x10 maze); change if you want trailing 'F' rows
 
 
@@ -30,29 +32,37 @@ FINISH_ROWS = 5          # keep 0 for now (pure 100x10 maze); change if you want
 _A = 0x51A ^ 0x1
 _B = (0xDEAD << 1) ^ 0xBEEF
 
+# One Mersenne Twister reseeded for every grid / keystream instead of a new Random() each time:
+# seed(n) leaves it in exactly the state Random(n) starts in
+_rng = random.Random()
+
 
 # -----------------------------
 # Minimal DP solvability check
 # -----------------------------
+# '.' -> b'1', any other byte -> b'0': a row's open cells as a binary string
+_OPEN_BITS = bytes(ord('1') if c == ord('.') else ord('0') for c in range(256))
+
+
+def open_mask(row: str) -> int:
+    """Bit c set <=> row[c] == '.'."""
+    return int(b'0' + row[::-1].encode('ascii').translate(_OPEN_BITS), 2)
+
+
 def solvable_any_start(rows: List[str]) -> bool:
     """True if any start column in top row can reach bottom row by moves {-1,0,+1} on '.' cells."""
-    R, C = len(rows), len(rows[0])
-    reach = {c for c in range(C) if rows[0][c] == '.'}
-    if not reach:
+    if not rows[0]:
         return False
 
-    for r in range(1, R):
-        nxt = set()
-        for c in reach:
-            for dc in (-1, 0, 1):
-                nc = c + dc
-                if 0 <= nc < C and rows[r][nc] == '.':
-                    nxt.add(nc)
+    # Reachable columns as a bitmask: one shift per direction spreads the whole frontier at once
+    reach = open_mask(rows[0])
+    if not reach:
+        return False
 
-        if not nxt:
+    for r in range(1, len(rows)):
+        reach = (reach | (reach << 1) | (reach >> 1)) & open_mask(rows[r])
+        if not reach:
             return False
-
-        reach = nxt
     return True
 
 
@@ -70,26 +80,45 @@ def gen_grid(seed: int,
     - Each row has at least one '.' (never fully blocked).
     - If ensure_solvable: guarantees at least one top-to-bottom path.
     """
-    r = random.Random(seed)
+    r = _rng
+    r.seed(seed)
+    rand = r.random
+    # start and finish rows are constant: built once, only the body rows draw random cells
+    start_row = '.' * width
+    finish_row = 'F' * width
+    cols = range(width)
     for attempt in range(1, max_tries + 1):
         grid = []
+        # columns reachable from the top row, as in solvable_any_start() (all of them before row 0);
+        # checked as rows are drawn so a dead attempt stops at its first blocked row
+        reach = -1
         for j in range(rows):
-            row = []
-            for i in range(width):
-                if j == 0:
-                    row.append('.')
-                elif j >= rows - FINISH_ROWS:
-                    row.append('F')
-                else:
-                    row.append('#' if r.random() < obstacle_rate else '.')
-
-
-            # ensure at least one open cell
-            if all(ch == '#' for ch in row):
-                row[r.randrange(width)] = '.'
-            grid.append(''.join(row))
-
-        if not ensure_solvable or solvable_any_start(grid):
+            if j == 0:
+                line = start_row
+            elif j >= rows - FINISH_ROWS:
+                line = finish_row
+            else:
+                row = []
+                blocked = 0  # '#' count of this row, kept up to date as cells are drawn
+                for _ in cols:
+                    if rand() < obstacle_rate:
+                        row.append('#')
+                        blocked += 1
+                    else:
+                        row.append('.')
+
+                # ensure at least one open cell
+                if blocked == width:
+                    row[r.randrange(width)] = '.'
+                line = ''.join(row)
+            grid.append(line)
+
+            if ensure_solvable:
+                reach = (reach | (reach << 1) | (reach >> 1)) & open_mask(line)
+                if not reach:
+                    break
+
+        if reach:
             return grid
 
         # tweak seed drift for next attempt
@@ -127,37 +156,45 @@ def read_plain_trk(path: Path) -> List[str]:
 # KS = bytes from random.Random(seed_key)
 # seed_key = seed ^ _A ^ crc32(filename) ^ _B
 # -----------------------------------------
+@lru_cache(maxsize=128)
+def _crc32_of(filename: str) -> int:
+    # zlib.crc32 is already hardware-backed: caching per name only skips the re-encode
+    return zlib.crc32(filename.encode()) & 0xFFFFFFFF
+
+
 def _seed_key(seed: int, filename: str) -> int:
-    key = (seed ^ _A ^ (zlib.crc32(filename.encode()) & 0xFFFFFFFF) ^ _B) & 0xFFFFFFFF
+    key = (seed ^ _A ^ _crc32_of(filename) ^ _B) & 0xFFFFFFFF
     return key
 
 
-def encrypt_trk_bytes(rows: List[str], seed: int, out_filename: str) -> bytes:
+def _xor_bytes(data: bytes, ks: bytes) -> bytes:
+    """XOR data with the first len(data) bytes of ks, done as one big-int XOR (in C, not byte by byte)."""
+    n = len(data)
+    x = int.from_bytes(data, 'little') ^ int.from_bytes(ks[:n], 'little')
+    return x.to_bytes(n, 'little')
+
+
+def encrypt_trk_bytes(rows: List[str], seed: int, out_filename: str, level: int = DEFAULT_ZLIB_LEVEL) -> bytes:
     payload = ''.join(rows).encode('ascii')
-    comp = zlib.compress(payload, 9)
+    comp = zlib.compress(payload, level)
     key = _seed_key(seed, out_filename)
-    rnd = random.Random(key)
+    rnd = _rng
+    rnd.seed(key)
 
-    # produce enough keystream for 4-byte size + compressed bytes
+    # produce enough keystream for 4-byte size + compressed bytes, in one call:
+    # randbytes() emits the same little-endian 32-bit words as repeated getrandbits(32)
+    # (the loader's keystream) as long as the length is a whole number of words
     ks_len = 4 + len(comp)
-    ks = bytearray()
-    while len(ks) < ks_len:
-        ks.extend(rnd.getrandbits(32).to_bytes(4, 'little'))
+    ks = rnd.randbytes((ks_len + 3) // 4 * 4)
 
-    out = bytearray(ks_len)
+    # XOR size + compressed body in a single pass
     size_le = len(payload).to_bytes(4, 'little')
-    # XOR size
-    for i in range(4):
-        out[i] = size_le[i] ^ ks[i]
-    # XOR compressed body
-    for i, b in enumerate(comp, start=4):
-        out[i] = b ^ ks[i]
-    return bytes(out)
+    return _xor_bytes(size_le + comp, ks)
 
 
-def write_encrypted_trk(rows: List[str], seed: int, out_path: Path) -> None:
+def write_encrypted_trk(rows: List[str], seed: int, out_path: Path, level: int = DEFAULT_ZLIB_LEVEL) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    blob = encrypt_trk_bytes(rows, seed, out_path.name)
+    blob = encrypt_trk_bytes(rows, seed, out_path.name, level)
     out_path.write_bytes(blob)
 
 
@@ -184,7 +221,7 @@ def cmd_encrypt(args: argparse.Namespace) -> None:
     src = Path(args.file)
     rows = read_plain_trk(src)
     dst = src.with_suffix(src.suffix + ".enc")
-    write_encrypted_trk(rows, args.seed, dst)
+    write_encrypted_trk(rows, args.seed, dst, args.level)
     print(f"[ok] wrote encrypted {dst.name} next to {src.name}")
 
 
@@ -205,7 +242,7 @@ def cmd_both(args: argparse.Namespace) -> None:
         print(f"    solvable_any_start: {solvable_any_start(rows)}")
     # encrypt separately
     enc_path = base.with_suffix(base.suffix + ".enc")
-    write_encrypted_trk(rows, args.seed, enc_path)
+    write_encrypted_trk(rows, args.seed, enc_path, args.level)
     print(f"[ok] wrote encrypted {enc_path.name}")
 
 
@@ -224,6 +261,7 @@ def build_parser() -> argparse.ArgumentParser:
     common.add_argument("--ensure-sovable", dest="ensure_solvable", action="store_true", help="Regenerate until solvable from some start")
     common.add_argument("--outdir", default="../student/tracks")
     common.add_argument("--show-stats", action="store_true")
+    common.add_argument("--level", type=int, default=DEFAULT_ZLIB_LEVEL, choices=range(10), metavar="0-9", help="zlib compression level of the .enc file")
 
     # generate
     g = sub.add_parser("generate", parents=[common])
@@ -234,6 +272,7 @@ def build_parser() -> argparse.ArgumentParser:
     e = sub.add_parser("encrypt")
     e.add_argument("--file", required=True, help="Path to plaintext .trk")
     e.add_argument("--seed", type=int, required=True, help="Seed originally used for generation")
+    e.add_argument("--level", type=int, default=DEFAULT_ZLIB_LEVEL, choices=range(10), metavar="0-9", help="zlib compression level of the .enc file")
     e.set_defaults(func=cmd_encrypt)
 
     # both
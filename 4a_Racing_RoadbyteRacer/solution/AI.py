@@ -1,7 +1,15 @@
 # AI.py
-from typing import List, Optional
+from typing import Dict, List, Optional
 from Engine import Engine
 
+# '#' -> b'0', any other byte -> b'1': a row reversed and translated is its open-cell bitmask in binary
+_OPEN_BITS = bytes(ord("0") if c == ord("#") else ord("1") for c in range(256))
+
+
+def open_mask(row: str) -> int:
+    """Bit x set <=> column x of the row is not a wall."""
+    return int(b"0" + row[::-1].encode("ascii").translate(_OPEN_BITS), 2)
+
 
 class AI:
     def __init__(self, max_depth: int = 5):
@@ -11,6 +19,11 @@ class AI:
         """
         self.max_depth = max_depth
         self.width = Engine.W
+        self._full = (1 << self.width) - 1  # deeper moves stay within [0..W-1]
+
+        # Open-cell mask of every row seen so far: the window only slides one row per tick, so each
+        # row is encoded once instead of once per tick it stays visible (at most 2^W distinct rows)
+        self._open_masks: Dict[str, int] = {}
 
     def exit(self):
         ...
@@ -35,6 +48,14 @@ class AI:
         if not visible_rows:
             return 0  # nothing to do
 
+        # Rows as open-cell bitmasks: the search then works on whole rows
+        cache = self._open_masks
+        open_masks = []
+        for row in visible_rows:
+            mask = cache.get(row)
+            if mask is None:
+                mask = cache[row] = open_mask(row)
+            open_masks.append(mask)
         width = len(visible_rows[0])
         #depth_limit = min(self.max_depth, len(visible_rows))
 
@@ -48,13 +69,13 @@ class AI:
                 continue  # out of bounds
 
             # Check if first step collides on the next row
-            if visible_rows[0][new_x] == "#":
+            if not (open_masks[0] >> new_x) & 1:
                 continue  # immediate crash, discard
 
             initial_cost = 1 if first_move != 0 else 0
 
             # Explore deeper moves over the next rows
-            total_cost = self._search_branch(visible_rows, 1, new_x, initial_cost)
+            total_cost = self._search_branch(open_masks, new_x, initial_cost)
 
             if total_cost is None:
                 # No safe continuation for this first move
@@ -67,45 +88,48 @@ class AI:
 
         return best_move
 
-    def _search_branch(self, visible_rows: List[str], depth: int, cur_x: int, cost_so_far: int) -> Optional[int]:
+    def _search_branch(self, open_masks: List[int], start_x: int, start_cost: int) -> Optional[int]:
         """
-        Recursive depth-limited search.
+        Depth-limited search, as a forward DP over row bitmasks instead of a 3-way recursion.
+        reach[c] holds, as one int, the columns whose cheapest path so far costs start_cost + c:
+        a row step spreads all of them at once with two shifts.
 
-        visible_rows: rows[0..depth_limit-1] ahead (0 already used by caller at depth=0).
-        depth: current depth in [1..depth_limit].
-        cur_x: current column at this depth.
-        cost_so_far: lateral movements accumulated so far.
+        open_masks: rows[0..depth_limit-1] ahead as open-cell masks (0 already used by caller at depth=0).
+        start_x: column reached at depth 0.
+        start_cost: lateral movements accumulated so far.
 
         Returns:
-            minimal total cost reachable from here (int), or
+            minimal total cost reachable at the horizon (int), or
             None if all continuations lead to collision.
         """
-        # If we reached the horizon, evaluate this path
-        if depth >= self.max_depth:
-            return cost_so_far
-
-        row = visible_rows[depth]
-        best: Optional[int] = None
-
-        for move in (-1, 0, 1):
-            nx = cur_x + move
-            if nx < 0 or nx >= self.width:
-                continue
-
-            if row[nx] == "#":
-                # This move would crash at this depth -> skip
-                continue
-
-            new_cost = cost_so_far + (1 if move != 0 else 0)
-            sub = self._search_branch(visible_rows, depth + 1, nx, new_cost)
-
-            if sub is None:
-                continue
-
-            if best is None or sub < best:
-                best = sub
-
-        return best
+        full = self._full
+        reach = [1 << start_x]
+
+        for depth in range(1, self.max_depth):
+            open_row = open_masks[depth] & full
+            next_reach = []
+            seen = 0  # columns already reached at a lower cost on this row
+            moved_in = 0
+
+            for stay in reach:
+                # cost c: stay from cost c, or one lateral move from cost c-1
+                cols = (stay | moved_in) & open_row & ~seen
+                next_reach.append(cols)
+                seen |= cols
+                moved_in = (stay << 1) | (stay >> 1)
+
+            # one more lateral move than the most expensive level so far
+            cols = moved_in & open_row & ~seen
+            if cols:
+                next_reach.append(cols)
+                seen |= cols
+
+            if not seen:
+                return None
+            reach = next_reach
+
+        # Reached the horizon: best path over all end columns
+        return start_cost + next(c for c, cols in enumerate(reach) if cols)
 
     def _is_better_move(self, candidate_cost: int, candidate_move: int, best_cost: int, best_move: int, car_x: int) -> bool:
         """
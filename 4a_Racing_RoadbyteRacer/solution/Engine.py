@@ -11,7 +11,8 @@ Rules:
 - Reaching the end of the stream = success
 """
 
-from typing import Callable, Iterable, List, Optional, Tuple
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Optional, Tuple
 
 
 class Engine:
@@ -45,8 +46,8 @@ class Engine:
         ai_func(visible_rows, cur_x) -> move in {-1, 0, +1}
         Returns: total number of horizontal movements performed.
         """
-        # Prime the buffer
-        buffer: List[str] = []
+        # Prime the buffer (a bounded deque: appending the next row drops the row just entered, in O(1))
+        buffer: Deque[str] = deque(maxlen=self.lookahead)
         it = iter(stream)
 
         # Load first row to determine width and set start position
@@ -59,12 +60,17 @@ class Engine:
         if width == 0:
             return 0, []
 
+        # Sanity: ensure row widths are consistent (each row is checked once, as it enters the window)
+        def check_width(row: str) -> str:
+            if len(row) != width:
+                raise ValueError("Inconsistent row width detected in stream.")
+            return row
 
         # Build initial lookahead window
         buffer.append(first_row)
         for _ in range(self.lookahead - 1):
             try:
-                buffer.append(next(it))
+                buffer.append(check_width(next(it)))
             except StopIteration:
                 break
 
@@ -73,16 +79,19 @@ class Engine:
         row_index = 0
         x = self.start_x
 
+        # The width is fixed for the whole stream: clamping becomes a table lookup, clamp[x + move + 1]
+        # (sized to also cover a start column beyond a narrow track)
+        clamp = tuple(max(0, min(width - 1, i)) for i in range(-1, max(width, x + 1) + 1))
+
         # Simulation loop:
         # At each tick, AI chooses move based on the current lookahead window.
         while True:
-            # Sanity: ensure row widths are consistent
-            if any(len(r) != width for r in buffer):
-                raise ValueError("Inconsistent row width detected in stream.")
-
             # Ask AI for the next horizontal move
+            # (the handler stays: a student AI may raise, and try costs nothing until it does)
             try:
-                move = int(ai_func(buffer[:], x))  # pass a shallow copy for safety
+                move = ai_func(list(buffer), x)  # pass a copy (as a list) for safety
+                if type(move) is not int:
+                    move = int(move)  # only convert what isn't a plain int already
                 path.append(move)
             except Exception as e:
                 move = 0
@@ -96,12 +105,13 @@ class Engine:
                 movements += 1
 
             # Apply move with clamping
-            x = max(0, min(width - 1, x + move))
+            x = clamp[x + move + 1]
 
             # Enter the next row (front of buffer) and check collision
-            current_row = buffer[0]
-            if not self._is_free(current_row[x]):
-                if self._is_goal(current_row[x]):
+            # (_is_free / _is_goal inlined: this runs once per tick)
+            cell = buffer[0][x]
+            if cell != ".":
+                if cell == "F":
                     # Collision: stop and report movements so far
                     print("Congratulation! you reach the goal!!!")
                     return movements, path
@@ -110,16 +120,15 @@ class Engine:
                 print("BANG! You hit a wall")
                 return movements, path
 
-            # Advance: pop the row we just entered
-            buffer.pop(0)
+            # Advance past the row we just entered
             row_index += 1
 
-            # Try to append one more row to maintain lookahead
+            # Try to append one more row to maintain lookahead (evicts the entered row from the front)
             try:
                 nxt = next(it)
-                buffer.append(nxt)
+                buffer.append(check_width(nxt))
             except StopIteration:
-                if self._is_goal(current_row[x]) == "F":
+                if self._is_goal(cell) == "F":
                     # Collision: stop and report movements so far
                     print("Congratulation! you reach the goal!!!")
                     return movements, path
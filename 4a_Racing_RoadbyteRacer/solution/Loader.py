@@ -16,8 +16,10 @@ Encrypted format (.trk.enc):
 """
 
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional
+import os
+from typing import Callable, Iterable, Iterator, List, Optional
 import random
 import zlib
 
@@ -27,6 +29,26 @@ _A = 0x51A ^ 0x1
 _B = (0xDEAD << 1) ^ 0xBEEF
 
 
+# Deletes every valid cell character: whatever translate() leaves behind is invalid
+_VALID_CELLS = str.maketrans("", "", ".#F")
+
+
+# Bytes read (and XORed, and fed to the inflater) per step when decrypting a track
+_CHUNK_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=128)
+def _crc32_of(filename: str) -> int:
+    # zlib.crc32 is already hardware-backed: caching per name only skips the re-encode
+    return zlib.crc32(filename.encode()) & 0xFFFFFFFF
+
+
+def _xor_bytes(data: bytes, ks: bytes) -> bytes:
+    """XOR data with an equal-length keystream slice, done as one big-int XOR (in C, not byte by byte)."""
+    n = len(data)
+    return (int.from_bytes(data, "little") ^ int.from_bytes(ks, "little")).to_bytes(n, "little")
+
+
 class Loader:
     def __init__(self, seed: int):
         """
@@ -49,71 +71,116 @@ class Loader:
 
     # ---------- Internal helpers ----------
     def _seed_key(self, filename: str) -> int:
-        return (self.seed ^ _A ^ (zlib.crc32(filename.encode()) & 0xFFFFFFFF) ^ _B) & 0xFFFFFFFF
+        return (self.seed ^ _A ^ _crc32_of(filename) ^ _B) & 0xFFFFFFFF
 
-    def _keystream(self, seed_key: int) -> Iterator[int]:
-        r = random.Random(seed_key)
-        while True:
-            n = r.getrandbits(32)
-            # little-endian 4 bytes
-            b = n.to_bytes(4, "little")
-            for by in b:
-                yield by
+    def _keystream(self, seed_key: int) -> Callable[[int], bytes]:
+        """
+        Keystream reader: each call returns the next n bytes of random.Random(seed_key).getrandbits(32)
+        words, little-endian, drawn with randbytes() (which emits exactly those words for whole words).
+        Any n is fine: the unused tail of a partly consumed word is kept for the next call.
+        """
+        randbytes = random.Random(seed_key).randbytes
+        spare = b""
+
+        def take(n: int) -> bytes:
+            nonlocal spare
+            if n > len(spare):
+                spare += randbytes((n - len(spare) + 3) // 4 * 4)
+            out, spare = spare[:n], spare[n:]
+            return out
+
+        return take
 
     def _stream_from_encrypted(self, p: Path) -> Iterator[str]:
         """
         .trk.enc reader:
         - XOR the first 4 bytes to get uncompressed size
-        - XOR the remainder and zlib.decompress
+        - XOR the remainder and zlib-decompress it, chunk by chunk
         - Split the raw payload into equal-width rows (width inferred from total size and row count)
           -> We infer width by reading the first row length from the plaintext companion if present,
              otherwise require that Engine validates widths. To keep it simple and robust, we enforce a
              fixed width discovered from the caller by slicing based on the first line length after decode.
         """
         fname = p.name
-        seed_key = self._seed_key(fname)
-        ks = self._keystream(seed_key)
-
-        data = p.read_bytes()
-        if len(data) < 4:
-            raise ValueError(f"Encrypted file too short: {p}")
-
-        # XOR size header
-        sz_bytes = bytes([data[i] ^ next(ks) for i in range(4)])
-        uncompressed_size = int.from_bytes(sz_bytes, "little")
-
-        # XOR compressed body
-        comp = bytes(b ^ next(ks) for b in data[4:])
-        raw = zlib.decompress(comp)
-
-        if len(raw) != uncompressed_size:
-            raise ValueError("Size mismatch after decrypt/decompress.")
-
-        # We don't have newlines in payload; rows are concatenated.
-        # To yield rows, we must infer the width. We do this lazily:
-        # - If there’s a matching plaintext .trk next to it, use its width.
-        # - Otherwise, assume the first 100 rows * 10 cols (default 100x10) if divisible.
-        # - If neither fits, raise for clarity.
-        width = self._infer_width_from_neighbor(p) or self._infer_default_width(len(raw))
-        if width is None or len(raw) % width != 0:
+        keystream = self._keystream(self._seed_key(fname))
+
+        fd = os.open(p, os.O_RDONLY)
+        try:
+            header = os.read(fd, 4)
+            if len(header) < 4:
+                raise ValueError(f"Encrypted file too short: {p}")
+            uncompressed_size = int.from_bytes(_xor_bytes(header, keystream(4)), "little")
+
+            # We don't have newlines in payload; rows are concatenated.
+            # To yield rows, we must infer the width. We do this lazily:
+            # - If there’s a matching plaintext .trk next to it, use its width.
+            # - Otherwise, assume the first 100 rows * 10 cols (default 100x10) if divisible.
+            # - If neither fits, raise for clarity.
+            width = self._infer_width_from_neighbor(p) or self._infer_default_width(uncompressed_size)
+            # (reported after the stream checks below, which a corrupt file fails first)
+            bad_width = width is None or uncompressed_size % width != 0
+
+            # Streamed: XOR a chunk, inflate it, yield the rows completed so far. The decrypt side
+            # only holds one chunk plus a partial row, never the whole file, plain copy and payload.
+            # A chunk's rows are held back until the next read shows the stream goes on, and the
+            # last ones until the end-of-stream and size checks pass: a caller stopping at the
+            # finish line still hears about a truncated file or a corrupt size header
+            dec = zlib.decompressobj()
+            pending = b""
+            held = ""
+            total = 0
+            while not dec.eof:
+                chunk = os.read(fd, _CHUNK_SIZE)
+                if not chunk:
+                    raise ValueError(f"Truncated encrypted payload: {p}")
+                pending += dec.decompress(_xor_bytes(chunk, keystream(len(chunk))))
+                size = total + len(pending)
+                if size > uncompressed_size or (dec.eof and size != uncompressed_size):
+                    raise ValueError("Size mismatch after decrypt/decompress.")
+                if bad_width:
+                    total = size
+                    pending = b""
+                    continue
+                for i in range(0, len(held), width):
+                    yield held[i : i + width]
+                whole = len(pending) - len(pending) % width
+                total += whole
+                # one ASCII decode per batch of whole rows, then plain str slices per row
+                held = pending[:whole].decode("ascii")
+                pending = pending[whole:]
+        finally:
+            os.close(fd)
+
+        if bad_width:
             raise ValueError("Unable to infer row width from encrypted payload size.")
-
-        for i in range(0, len(raw), width):
-            yield raw[i : i + width].decode("ascii")
+        for i in range(0, len(held), width):
+            yield held[i : i + width]
 
     def _infer_width_from_neighbor(self, p: Path) -> Optional[int]:
         """
         If a plaintext sibling exists (same stem without .enc), use its first line length as width.
         """
         try_plain = p.with_suffix("")  # remove .enc suffix
-        if try_plain.exists() and try_plain.is_file():
-            # read first non-empty line
-            with try_plain.open("r", encoding="ascii") as f:
-                for line in f:
-                    line = line.rstrip("\n")
+        if not try_plain.is_file():
+            return None
+
+        # read first non-empty line: a few raw os.read() chunks, no buffered text file for one line
+        fd = os.open(try_plain, os.O_RDONLY)
+        try:
+            buf = b""
+            while True:
+                chunk = os.read(fd, 4096)
+                buf += chunk
+                lines = buf.splitlines()  # \n, \r\n and \r, as text mode's universal newlines
+                if chunk and not buf.endswith((b"\n", b"\r")):
+                    lines.pop()  # the last line may go on in the next chunk
+                for line in lines:
                     if line:
                         return len(line)
-        return None
+                if not chunk:
+                    return None
+        finally:
+            os.close(fd)
 
     def _infer_default_width(self, total_bytes: int) -> Optional[int]:
         """
@@ -145,6 +212,6 @@ class Loader:
                     raise ValueError(f"Inconsistent row width in {p}: expected {width}, got {len(row)}")
                 # Optional: validate characters
                 # Treat only '.' and '#' as valid; ignore others defensively.
-                if any(ch not in ('.', '#', 'F') for ch in row):
+                if row.translate(_VALID_CELLS):
                     raise ValueError("Invalid characters in plaintext track.")
                 yield row
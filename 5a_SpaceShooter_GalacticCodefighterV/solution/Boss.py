@@ -1,9 +1,14 @@
+import math
+
 from EnemyShip import EnemyShip
+from ai_api import EnemyKind
 
 
 class Boss(EnemyShip):
+    moving = True  # always oscillating
+
     def __init__(self, x: float, y: float):
-        super().__init__(x, y, enemy_type="boss")
+        super().__init__(x, y, enemy_type=EnemyKind.BOSS)
         self.hp = 50
         self.speed = 80.0
         # Boss-specific behaviour variables
@@ -13,7 +18,6 @@ class Boss(EnemyShip):
     def update(self, dt: float) -> None:
         self.time_in_phase += dt
         # Example: simple horizontal oscillation
-        import math
         self.x += math.sin(self.time_in_phase) * self.speed * dt
 
         super().update(dt)
@@ -0,0 +1,29 @@
+from typing import List
+
+from EnemyShip import EnemyShip
+from ai_api import EnemyKind
+
+
+class EnemyPool:
+    """
+    Recycles EnemyShip instances across waves.
+
+    Waves spawn and lose enemies continuously: instead of building a new ship
+    (Sprite, Rect and all) on every spawn, dead ships are handed back here by the
+    Engine and reset in place on the next spawn.
+    """
+
+    def __init__(self, size: int = 16):
+        self._free: List[EnemyShip] = [EnemyShip(0.0, 0.0) for _ in range(size)]
+
+    def acquire(self, x: float, y: float, enemy_type: EnemyKind = EnemyKind.BASIC) -> EnemyShip:
+        """Return a ship in the same state as EnemyShip(x, y, enemy_type)."""
+        if not self._free:
+            return EnemyShip(x, y, enemy_type=enemy_type)
+        enemy = self._free.pop()
+        enemy.reset(x, y, enemy_type)
+        return enemy
+
+    def release(self, enemy: EnemyShip) -> None:
+        """Hand back a ship that has left the game (no one else may keep using it)."""
+        self._free.append(enemy)
@@ -1,9 +1,10 @@
 from Ship import Ship
+from ai_api import EnemyKind
 import math
 
 
 class EnemyShip(Ship):
-    def __init__(self, x: float, y: float, enemy_type: str = "basic"):
+    def __init__(self, x: float, y: float, enemy_type: EnemyKind = EnemyKind.BASIC):
         super().__init__(x, y, width=24, height=24, hp=1, speed=100.0)
 
         self.enemy_type = enemy_type
@@ -19,6 +20,32 @@ class EnemyShip(Ship):
         self.time_to_target = 0.0
         self.time_elapsed = 0.0
 
+    def reset(self, x: float, y: float, enemy_type: EnemyKind = EnemyKind.BASIC) -> None:
+        """
+        Bring a pooled ship back to the state of a freshly built EnemyShip(x, y, enemy_type).
+        """
+        self.x = x
+        self.y = y
+        self.alive = True
+        self._ix = int(x)
+        self._iy = int(y)
+        self.rect.topleft = (self._ix, self._iy)
+        self.hp = 1
+        self.speed = 100.0
+        self.sprite_image = None
+
+        self.enemy_type = enemy_type
+        self.wave_controller = None
+
+        self.vx = 0.0
+        self.vy = 0.0
+        self.has_target = False
+
+        self.target_x = 0.0
+        self.target_y = 0.0
+        self.time_to_target = 0.0
+        self.time_elapsed = 0.0
+
     # ---------------------------------------------------------
     # High-level movement commands
     # ---------------------------------------------------------
@@ -40,6 +67,7 @@ class EnemyShip(Ship):
             self.vx = 0.0
             self.vy = 0.0
             self.has_target = False
+            super().update(0.0)  # a parked ship is not updated anymore: sync its rect now
             return
 
         self.time_to_target = duration
@@ -52,6 +80,14 @@ class EnemyShip(Ship):
         self.vx = dx / duration
         self.vy = dy / duration
 
+    @property
+    def moving(self) -> bool:
+        """
+        False while the ship sits still (no scripted move, no drift): update() would leave it
+        exactly where it is, so the Engine skips it.
+        """
+        return self.has_target or self.vx != 0.0 or self.vy != 0.0
+
     def clear_move(self):
         """Stops scripted movement, keeps last velocity."""
         self.has_target = False
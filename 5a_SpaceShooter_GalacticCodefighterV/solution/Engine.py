@@ -5,6 +5,7 @@ from typing import List, Optional
 
 from Boss import Boss
 from Bullet import Bullet
+from EnemyPool import EnemyPool
 from EnemyShip import EnemyShip
 from PlayerShip import PlayerShip
 from SpaceAI import SpaceAI
@@ -25,8 +26,13 @@ class Engine:
 
         # Entities
         self.player = PlayerShip(screen_width // 2, screen_height - 80)
-        self.enemies: List[EnemyShip] = []
+        self.enemies: List[EnemyShip] = []   # every ship on screen, bosses included (draw/collision order)
+        self.bosses: List[Boss] = []         # the bosses among them, so no one has to filter by type
         self.bullets: List[Bullet] = []
+        # Regular (non-boss) enemies alive: +1 per spawn (WaveFormation), -1 when dropped in _cleanup
+        self.alive_non_boss_count: int = 0
+        # Dead regular enemies go back here, and spawns reuse them
+        self.enemy_pool = EnemyPool()
 
         # Waves
         self.waves = WaveFormation(self)
@@ -87,8 +93,10 @@ class Engine:
         # Update entities
         self.player.update(dt)
 
+        # Parked ships (the waves hold formation) have nothing to update
         for e in self.enemies:
-            e.update(dt)
+            if e.moving:
+                e.update(dt)
 
         for b in self.bullets:
             b.update(dt)
@@ -156,28 +164,20 @@ class Engine:
             if e.alive
         ]
 
-        player_bullets_state = [
-            BulletState(b.x, b.y, b.vx, b.vy, b.from_player)
-            for b in self.bullets
-            if b.from_player
-        ]
+        # One pass splits the bullets by owner
+        player_bullets_state = []
+        enemy_bullets_state = []
+        for b in self.bullets:
+            (player_bullets_state if b.from_player else enemy_bullets_state).append(
+                BulletState(b.x, b.y, b.vx, b.vy, b.from_player)
+            )
 
-        enemy_bullets_state = [
-            BulletState(b.x, b.y, b.vx, b.vy, b.from_player)
-            for b in self.bullets
-            if not b.from_player
-        ]
-
-        # Simple wave/boss info
-        boss_hp = None
-        for e in self.enemies:
-            if isinstance(e, Boss) and e.alive:
-                boss_hp = e.hp
-                break
+        # Simple wave/boss info (regular enemies are counted as they spawn and die)
+        boss_hp = next((b.hp for b in self.bosses if b.alive), None)
 
         wave_state = WaveState(
             current_wave=self.waves.current_wave,
-            enemies_remaining=len([e for e in self.enemies if e.alive and not isinstance(e, Boss)]),
+            enemies_remaining=self.alive_non_boss_count,
             boss_hp=boss_hp,
         )
 
@@ -201,6 +201,11 @@ class Engine:
           - Enemies vs player (ramming)
         """
 
+        # Alive enemies and their rects as two parallel columns: each bullet is tested against
+        # the whole swarm in one Rect.collidelist() call, which returns the first hit in order
+        live_enemies = [e for e in self.enemies if e.alive]
+        enemy_rects = [e.rect for e in live_enemies]
+
         # ---------------------------------------------------------
         # 1. Player bullets → Enemy ships
         # ---------------------------------------------------------
@@ -208,46 +213,53 @@ class Engine:
             if not bullet.alive or not bullet.from_player:
                 continue
 
-            for enemy in self.enemies:
-                if not enemy.alive:
-                    continue
+            i = bullet.rect.collidelist(enemy_rects)
+            if i < 0:
+                continue
 
-                if bullet.rect.colliderect(enemy.rect):
-                    enemy.take_damage(1)
-                    bullet.alive = False
-                    break  # Bullet can only hit one enemy
+            enemy = live_enemies[i]
+            enemy.take_damage(1)
+            bullet.alive = False  # Bullet can only hit one enemy
+            if not enemy.alive:
+                del live_enemies[i], enemy_rects[i]
 
         # ---------------------------------------------------------
         # 2. Enemy bullets → Player ship
         # ---------------------------------------------------------
-        for bullet in self.bullets:
-            if not bullet.alive or bullet.from_player:
-                continue
-
-            if bullet.rect.colliderect(self.player.rect):
-                # Player takes damage
-                self.player.take_damage(1)
-                bullet.alive = False
+        # The player is a single rect: one collidelistall() call against all incoming bullets
+        incoming = [b for b in self.bullets if b.alive and not b.from_player]
+        for i in self.player.rect.collidelistall([b.rect for b in incoming]):
+            # Player takes damage
+            self.player.take_damage(1)
+            incoming[i].alive = False
 
         # ---------------------------------------------------------
         # 3. Enemy ships → Player ship (ramming)
         # ---------------------------------------------------------
-        for enemy in self.enemies:
-            if not enemy.alive:
-                continue
-
-            if enemy.rect.colliderect(self.player.rect):
-                # Both take damage (classic shmup ramming)
-                self.player.take_damage(1)
-                enemy.take_damage(9999)  # insta-kill enemy
+        # enemy_rects still holds exactly the enemies left alive by the bullets above
+        for i in self.player.rect.collidelistall(enemy_rects):
+            # Both take damage (classic shmup ramming)
+            self.player.take_damage(1)
+            live_enemies[i].take_damage(9999)  # insta-kill enemy
 
     def _cleanup(self) -> None:
         self.bullets = [b for b in self.bullets if b.alive]
-        self.enemies = [e for e in self.enemies if e.alive]
+
+        # One pass keeps the survivors and retires the dead (boss list, alive counter, pool)
+        alive = []
+        for e in self.enemies:
+            if e.alive:
+                alive.append(e)
+            elif type(e) is Boss:
+                self.bosses.remove(e)
+            else:
+                self.alive_non_boss_count -= 1
+                self.enemy_pool.release(e)
+        self.enemies = alive
 
     def _check_win_condition(self) -> None:
         # Win when boss is dead and all waves done
-        boss_alive = any(isinstance(e, Boss) and e.alive for e in self.enemies)
+        boss_alive = any(b.alive for b in self.bosses)
         if self.waves.current_wave > self.waves.total_waves and not boss_alive:
             self.game_won = True
 
@@ -1,4 +1,4 @@
-import math
+from math import sqrt
 
 from Ship import Ship
 
@@ -33,16 +33,19 @@ class PlayerShip(Ship):
 
         dx = self.dest_x - self.x
         dy = self.dest_y - self.y
-        dist_sq = dx * dx + dy * dy
 
-        if dist_sq > 1.0:
-            # normalize
-            dist = math.sqrt(dist_sq)
-            vx = dx / dist * self.speed
-            vy = dy / dist * self.speed
-
-            self.x += vx * dt
-            self.y += vy * dt
+        # Parked on the destination most of the time: the Manhattan check settles that case
+        # before any squaring (|dx| + |dy| < 0.5 implies dist_sq < 1, which never moves)
+        if abs(dx) + abs(dy) >= 0.5:
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > 1.0:
+                # normalize
+                dist = sqrt(dist_sq)
+                vx = dx / dist * self.speed
+                vy = dy / dist * self.speed
+
+                self.x += vx * dt
+                self.y += vy * dt
 
         super().update(dt)
 
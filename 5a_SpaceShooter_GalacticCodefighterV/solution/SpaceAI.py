@@ -25,8 +25,15 @@ class SpaceAI:
             return AICommand(set_destination=False, dest_x=0, dest_y=0, shoot=False)
 
 
-        # Find nearest enemy by vertical distance
-        nearest = min(state.enemies, key=lambda e: abs(e.y - state.player.y))
+        # Find nearest enemy by vertical distance (first one wins ties, like min())
+        py = state.player.y
+        nearest = None
+        best_d = 0.0
+        for e in state.enemies:
+            d = abs(e.y - py)
+            if nearest is None or d < best_d:
+                nearest = e
+                best_d = d
 
         move_x = 0
         if nearest.x < state.player.x:
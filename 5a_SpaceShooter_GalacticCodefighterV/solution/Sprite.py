@@ -10,11 +10,19 @@ class Sprite:
         self.alive = True
 
         # For collision
-        self.rect = pygame.Rect(int(x), int(y), width, height)
+        self._ix = int(x)
+        self._iy = int(y)
+        self.rect = pygame.Rect(self._ix, self._iy, width, height)
 
     def update(self, dt: float) -> None:
         """Update logic, dt in seconds."""
-        self.rect.topleft = (int(self.x), int(self.y))
+        # Only touch the rect when the position crosses a pixel boundary (parked ships never do)
+        ix = int(self.x)
+        iy = int(self.y)
+        if ix != self._ix or iy != self._iy:
+            self._ix = ix
+            self._iy = iy
+            self.rect.topleft = (ix, iy)
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw sprite. Default: debug rectangle."""
@@ -1,7 +1,102 @@
 # waves.py
+from collections import deque
+from functools import lru_cache
+
 from Boss import Boss
-from EnemyShip import EnemyShip
-from typing import List, Tuple, Optional
+from ai_api import EnemyKind
+from typing import Deque, List, Tuple, Optional
+
+
+# ----------------------------------------------------------------------
+# Stream pattern positions
+# ----------------------------------------------------------------------
+
+def _triangle_stream_positions(width: int) -> List[Tuple[float, float]]:
+    center_x = width // 2
+    base_y = -50
+    row_spacing = 40
+    col_spacing = 40
+
+    positions: List[Tuple[float, float]] = []
+
+    # Row 1 (apex)
+    positions.append((center_x, base_y))
+
+    # Row 2
+    positions.append((center_x - col_spacing, base_y + row_spacing))
+    positions.append((center_x + col_spacing, base_y + row_spacing))
+
+    # Row 3
+    positions.append((center_x - 2 * col_spacing, base_y + 2 * row_spacing))
+    positions.append((center_x,                 base_y + 2 * row_spacing))
+    positions.append((center_x + 2 * col_spacing, base_y + 2 * row_spacing))
+
+    # Optional row 4 if you want more difficulty:
+    # positions.append((center_x, base_y + 3 * row_spacing))
+
+    # Enemies will spawn in this order
+    return positions
+
+
+def _staggered_stream_positions(width: int) -> List[Tuple[float, float]]:
+    left_x = int(width * 0.2)
+    right_x = int(width * 0.8)
+    base_y = -40
+    row_spacing = 30
+
+    positions: List[Tuple[float, float]] = []
+
+    # Alternating left / right positions going down
+    side = "left"
+    for i in range(8):
+        y = base_y + i * row_spacing
+        x = left_x if side == "left" else right_x
+        positions.append((x, y))
+        side = "right" if side == "left" else "left"
+
+    return positions
+
+
+def _v_stream_positions(width: int) -> List[Tuple[float, float]]:
+    center_x = width // 2
+    base_y = -40
+    row_spacing = 35
+    col_spacing = 45
+
+    positions: List[Tuple[float, float]] = [(center_x, base_y)]
+
+    # Next rows of the V
+    for i in range(1, 5):
+        y = base_y + i * row_spacing
+        positions.append((center_x - i * col_spacing, y))
+        positions.append((center_x + i * col_spacing, y))
+
+    return positions
+
+
+_STREAM_BUILDERS = {
+    "triangle_stream": _triangle_stream_positions,
+    "staggered_left_right": _staggered_stream_positions,
+    "v_stream": _v_stream_positions,
+}
+
+
+@lru_cache(maxsize=None)
+def _build_positions(pattern: str, width: int) -> Tuple[Tuple[float, float], ...]:
+    """
+    Spawn positions of a stream pattern, in spawn order.
+    The screen width is fixed for a session, so each table is computed once and replayed every wave.
+    """
+    return tuple(_STREAM_BUILDERS[pattern](width))
+
+
+@lru_cache(maxsize=None)
+def _line_xs(width: int, num_enemies: int) -> Tuple[int, ...]:
+    """
+    X positions of an evenly spaced line of num_enemies ships across the screen.
+    """
+    spacing = width // (num_enemies + 1)
+    return tuple(spacing * (i + 1) for i in range(num_enemies))
 
 
 class WaveFormation:
@@ -20,14 +115,15 @@ class WaveFormation:
         self.current_wave: int = 1
         self.total_waves: int = 5
         self.boss_spawned: bool = False
+        self.done: bool = False                 # True once the boss wave has started: nothing left to run
 
         # Per-wave spawn state
         self.wave_active: bool = False          # True when a wave is ongoing
-        self.pending_spawns: List[Tuple[float, float]] = []  # (x, y) for yet-to-spawn enemies
+        self.pending_spawns: Deque[Tuple[float, float]] = deque()  # (x, y) for yet-to-spawn enemies, in spawn order
         self.spawn_interval: float = 0.0        # time between spawns for stream patterns
         self.spawn_timer: float = 0.0           # accumulates dt
 
-        # Simple pattern mapping for 5 waves
+        # Simple pattern mapping for 5 waves (the boss follows as wave total_waves + 1, see _start_wave)
         # You can tweak this easily.
         self.wave_patterns = {
             1: "line_simple",               # Level 1 simple line, starting off-screen, moving to middle of the screen, they do not fight back, they do not move
@@ -37,6 +133,16 @@ class WaveFormation:
             5: "v_stream",                  # Level 3, triangle, starting off-screen, moving to middle of the screen, shooting all at the same time
         }
 
+        # Pattern name -> starter method, bound once
+        self._wave_starters = {
+            "line_simple": self._start_line_simple,
+            "line_dense": self._start_line_dense,
+            "triangle_stream": self._start_triangle_stream,
+            "staggered_left_right": self._start_staggered_stream,
+            "v_stream": self._start_v_stream,
+            "boss": self._start_boss,
+        }
+
         # Immediately prepare the first wave
         self._start_wave(self.current_wave)
 
@@ -49,27 +155,29 @@ class WaveFormation:
         Called every frame by Engine.
         Handles spawning logic and transitions between waves / boss.
         """
-        if self.current_wave <= self.total_waves:
-            # Handle normal waves
-            if not self.wave_active:
-                # Start the next wave
-                self._start_wave(self.current_wave)
-
-            # Handle timed spawns for the current wave
-            self._update_spawning(dt)
-
-            # Check if current wave is completely done
-            if self._wave_cleared():
-                self.current_wave += 1
-                self.wave_active = False
-                self.pending_spawns.clear()
-                self.spawn_timer = 0.0
-
-        else:
-            # All waves done → boss phase
-            if not self.boss_spawned:
-                self._spawn_boss()
-                self.boss_spawned = True
+        if self.done:
+            return
+
+        # Quiet frame (everything spawned, regular enemies still alive): nothing below can
+        # change, the alive counter is exact so there is no cached result to invalidate
+        if self.wave_active and not self.pending_spawns and self.engine.alive_non_boss_count:
+            return
+
+        if not self.wave_active:
+            # Start the next wave (after the regular ones, that is the boss)
+            self._start_wave(self.current_wave)
+            if self.done:
+                return
+
+        # Handle timed spawns for the current wave
+        self._update_spawning(dt)
+
+        # Check if current wave is completely done
+        if self._wave_cleared():
+            self.current_wave += 1
+            self.wave_active = False
+            self.pending_spawns.clear()
+            self.spawn_timer = 0.0
 
     # ----------------------------------------------------------------------
     # Wave lifecycle
@@ -79,41 +187,54 @@ class WaveFormation:
         """
         Initialize the given wave: choose pattern, prepare spawn list and timers.
         """
-        pattern = self.wave_patterns.get(wave_index, "line_simple")
-        width = self.engine.screen_width
+        # Past total_waves comes the boss (also when total_waves is tweaked below 5)
+        if wave_index > self.total_waves:
+            pattern = "boss"
+        else:
+            pattern = self.wave_patterns.get(wave_index, "line_simple")
 
         self.wave_active = True
         self.pending_spawns.clear()
         self.spawn_timer = 0.0
 
-        if pattern == "line_simple":
-            # All at once, simple horizontal line
-            num_enemies = 4 + wave_index  # slightly increasing
-            self._spawn_line(num_enemies, y=-60)
-
-        elif pattern == "line_dense":
-            # More enemies in a line, maybe lower on the screen
-            num_enemies = 6 + wave_index
-            self._spawn_line(num_enemies, y=-80)
-
-        elif pattern == "triangle_stream":
-            # Triangle formation, but spawned ONE BY ONE over time
-            self._prepare_triangle_stream()
-            self.spawn_interval = 0.7   # seconds between enemies
-
-        elif pattern == "staggered_left_right":
-            # Left-right stagger pattern streaming in
-            self._prepare_staggered_stream()
-            self.spawn_interval = 0.5
-
-        elif pattern == "v_stream":
-            # V-shaped formation spawning in sequence
-            self._prepare_v_stream()
-            self.spawn_interval = 0.5
-
-        else:
-            # Fallback: simple line
-            self._spawn_line(5 + wave_index, y=-60)
+        # One dict lookup picks the pattern's starter (unknown names fall back to a simple line)
+        self._wave_starters.get(pattern, self._start_fallback)(wave_index)
+
+    def _start_line_simple(self, wave_index: int) -> None:
+        # All at once, simple horizontal line
+        num_enemies = 4 + wave_index  # slightly increasing
+        self._spawn_line(num_enemies, y=-60)
+
+    def _start_line_dense(self, wave_index: int) -> None:
+        # More enemies in a line, maybe lower on the screen
+        num_enemies = 6 + wave_index
+        self._spawn_line(num_enemies, y=-80)
+
+    def _start_triangle_stream(self, wave_index: int) -> None:
+        # Triangle formation, but spawned ONE BY ONE over time
+        self._prepare_triangle_stream()
+        self.spawn_interval = 0.7   # seconds between enemies
+
+    def _start_staggered_stream(self, wave_index: int) -> None:
+        # Left-right stagger pattern streaming in
+        self._prepare_staggered_stream()
+        self.spawn_interval = 0.5
+
+    def _start_v_stream(self, wave_index: int) -> None:
+        # V-shaped formation spawning in sequence
+        self._prepare_v_stream()
+        self.spawn_interval = 0.5
+
+    def _start_boss(self, wave_index: int) -> None:
+        # All waves done → boss phase: no timed spawns and no clear check, the game is decided by the Engine
+        self._spawn_boss()
+        self.boss_spawned = True
+        self.wave_active = False
+        self.done = True
+
+    def _start_fallback(self, wave_index: int) -> None:
+        # Fallback: simple line
+        self._spawn_line(5 + wave_index, y=-60)
 
     # ----------------------------------------------------------------------
     # Spawn pattern helpers
@@ -123,86 +244,32 @@ class WaveFormation:
         """
         Spawn a full line of enemies at once.
         """
-        width = self.engine.screen_width
-        spacing = width // (num_enemies + 1)
+        engine = self.engine
+        acquire = engine.enemy_pool.acquire
+        add = engine.enemies.append
 
-        for i in range(num_enemies):
-            x = spacing * (i + 1)
-            enemy = EnemyShip(x, y, enemy_type="basic")
-            self.engine.enemies.append(enemy)
+        for x in _line_xs(engine.screen_width, num_enemies):
+            add(acquire(x, y, enemy_type=EnemyKind.BASIC))
+        engine.alive_non_boss_count += num_enemies
 
     def _prepare_triangle_stream(self) -> None:
         """
         Prepare positions for a triangle formation, but do NOT spawn yet.
         They will be spawned one by one over time in _update_spawning().
         """
-        width = self.engine.screen_width
-        center_x = width // 2
-        base_y = -50
-        row_spacing = 40
-        col_spacing = 40
-
-        positions: List[Tuple[float, float]] = []
-
-        # Row 1 (apex)
-        positions.append((center_x, base_y))
-
-        # Row 2
-        positions.append((center_x - col_spacing, base_y + row_spacing))
-        positions.append((center_x + col_spacing, base_y + row_spacing))
-
-        # Row 3
-        positions.append((center_x - 2 * col_spacing, base_y + 2 * row_spacing))
-        positions.append((center_x,                 base_y + 2 * row_spacing))
-        positions.append((center_x + 2 * col_spacing, base_y + 2 * row_spacing))
-
-        # Optional row 4 if you want more difficulty:
-        # positions.append((center_x, base_y + 3 * row_spacing))
-
-        # Enemies will spawn in this order
-        self.pending_spawns.extend(positions)
+        self.pending_spawns.extend(_build_positions("triangle_stream", self.engine.screen_width))
 
     def _prepare_staggered_stream(self) -> None:
         """
         Prepare a zig-zag / staggered pattern entering one by one.
         """
-        width = self.engine.screen_width
-        left_x = int(width * 0.2)
-        right_x = int(width * 0.8)
-        base_y = -40
-        row_spacing = 30
-
-        positions: List[Tuple[float, float]] = []
-
-        # Alternating left / right positions going down
-        side = "left"
-        for i in range(8):
-            y = base_y + i * row_spacing
-            x = left_x if side == "left" else right_x
-            positions.append((x, y))
-            side = "right" if side == "left" else "left"
-
-        self.pending_spawns.extend(positions)
+        self.pending_spawns.extend(_build_positions("staggered_left_right", self.engine.screen_width))
 
     def _prepare_v_stream(self) -> None:
         """
         Prepare a 'V' shape entering point-first, one enemy at a time.
         """
-        width = self.engine.screen_width
-        center_x = width // 2
-        base_y = -40
-        row_spacing = 35
-        col_spacing = 45
-
-        positions: List[Tuple[float, float]] = [(center_x, base_y)]
-
-        # Next rows of the V
-        for i in range(1, 5):
-            y = base_y + i * row_spacing
-            positions.append((center_x - i * col_spacing, y))
-            positions.append((center_x + i * col_spacing, y))
-
-        self.pending_spawns.extend(positions)
+        self.pending_spawns.extend(_build_positions("v_stream", self.engine.screen_width))
 
     # ----------------------------------------------------------------------
     # Spawning updates and wave completion
@@ -213,16 +280,22 @@ class WaveFormation:
         For patterns that spawn enemies over time, handle timers and spawn.
         For instant patterns, pending_spawns will be empty and this does nothing.
         """
-        if not self.pending_spawns:
+        pending = self.pending_spawns
+        if not pending:
             return  # nothing queued
 
         # Accumulate time and spawn whenever we reach the interval
-        self.spawn_timer += dt
-        while self.spawn_timer >= self.spawn_interval and self.pending_spawns:
-            self.spawn_timer -= self.spawn_interval
-            x, y = self.pending_spawns.pop(0)
-            enemy = EnemyShip(x, y, enemy_type="basic")
-            self.engine.enemies.append(enemy)
+        # (state read into locals once, written back once: the loop only touches locals)
+        engine = self.engine
+        interval = self.spawn_interval
+        timer = self.spawn_timer + dt
+        while timer >= interval and pending:
+            timer -= interval
+            x, y = pending.popleft()
+            enemy = engine.enemy_pool.acquire(x, y, enemy_type=EnemyKind.BASIC)
+            engine.enemies.append(enemy)
+            engine.alive_non_boss_count += 1
+        self.spawn_timer = timer
 
     def _wave_cleared(self) -> bool:
         """
@@ -230,16 +303,8 @@ class WaveFormation:
           - no pending spawns AND
           - no alive non-boss enemies remain.
         """
-        if self.pending_spawns:
-            return False
-
-        for e in self.engine.enemies:
-            if isinstance(e, Boss):
-                continue
-            if e.alive:
-                return False
-
-        return True
+        # The Engine keeps the alive non-boss count up to date: no scan over the enemies
+        return not self.pending_spawns and self.engine.alive_non_boss_count == 0
 
     # ----------------------------------------------------------------------
     # Boss
@@ -251,3 +316,4 @@ class WaveFormation:
         """
         boss = Boss(self.engine.screen_width // 2, 80)
         self.engine.enemies.append(boss)
+        self.engine.bosses.append(boss)
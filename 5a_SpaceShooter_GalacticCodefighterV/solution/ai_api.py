@@ -1,8 +1,9 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AICommand:
     # If True, engine updates its internal destination to (dest_x, dest_y).
     # If False, engine keeps the previous destination and just uses `shoot`.
@@ -14,7 +15,7 @@ class AICommand:
     shoot: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayerState:
     x: float
     y: float
@@ -24,15 +25,26 @@ class PlayerState:
     cooldown: float  # seconds until next allowed shot
 
 
-@dataclass(frozen=True)
+class EnemyKind(str, Enum):
+    # Still plain strings ("basic" == EnemyKind.BASIC), but also one shared object per kind,
+    # so `e.enemy_type is EnemyKind.BOSS` is a pointer compare
+    BASIC = "basic"
+    KAMIKAZE = "kamikaze"
+    BOSS = "boss"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True, slots=True)
 class EnemyState:
     x: float
     y: float
     hp: int
-    enemy_type: str  # "basic", "kamikaze", "boss", etc.
+    enemy_type: EnemyKind  # BASIC ("basic"), KAMIKAZE ("kamikaze"), BOSS ("boss")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BulletState:
     x: float
     y: float
@@ -41,14 +53,14 @@ class BulletState:
     from_player: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaveState:
     current_wave: int        # 1-5 = regular, 6 = boss, etc.
     enemies_remaining: int
     boss_hp: Optional[int]   # None if no boss on screen
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NavigationStatus:
     has_destination: bool
     dest_x: float
@@ -57,7 +69,7 @@ class NavigationStatus:
     distance: float          # current distance to the destination
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     width: int
     height: int
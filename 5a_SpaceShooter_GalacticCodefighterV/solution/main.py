@@ -1,3 +1,5 @@
+# The game loop is plain Python: on a CPython 3.13+ build with the experimental JIT
+# (configured with --enable-experimental-jit), run with PYTHON_JIT=1 to enable it.
 from Engine import Engine
 
 